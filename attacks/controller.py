@@ -4,7 +4,6 @@
 
 import json
 import threading
-import time
 from pathlib import Path
 from typing import Sequence
 
@@ -184,10 +183,11 @@ def _run(self) -> None:
             )
 
         if self.attack_type in {"load", "packetloss-load"}:
+            target_names = set(self.target_names)
             sources = [
                 node
                 for node in self.client_nodes
-                if node.name in self.target_names
+                if node.name in target_names
             ] or list(self.client_nodes)
             self._load_injector = SyntheticLoadInjector(
                 runtime=self.runtime,
@@ -228,10 +228,6 @@ def _run(self) -> None:
         self.write_metadata()
 
     def _sleep(self, duration: float) -> bool:
-        deadline = time.time() + max(duration, 0.0)
-
-        while not self._stop.is_set() and time.time() < deadline:
-            remaining = max(deadline - time.time(), 0.0)
-            time.sleep(min(remaining, 0.25))
-
-        return not self._stop.is_set()
+        # Event.wait() returns as soon as stop() is called instead of finishing
+        # the current polling slice.
+        return not self._stop.wait(max(duration, 0.0))
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import random
+import re
 import shlex
 from typing import Any, Iterable, Sequence
 
@@ -10,6 +11,10 @@
 
 COMMENT = "meshpay-jamming"
 
+# One "<chain> <packets> <bytes>" line per matching rule, as printed by the
+# awk filter in collect_packet_loss_stats().
+_RULE_STATS_RE = re.compile(r"^\s*(INPUT|OUTPUT)\s+(\d+)\s+(\d+)", re.MULTILINE)
+
 
 def parse_target_count(value: str | int, total_nodes: int) -> int:
     max_targets = max(0, total_nodes // 3)
@@ -44,19 +49,11 @@ def _parse_iptables_rule_stats(output: str) -> dict[str, dict[str, int]]:
         "INPUT": {"packets": 0, "bytes": 0, "rules": 0},
         "OUTPUT": {"packets": 0, "bytes": 0, "rules": 0},
     }
-    for raw_line in output.splitlines():
-        parts = raw_line.strip().split()
-        if len(parts) < 3 or parts[0] not in stats:
-            continue
-        chain = parts[0]
-        try:
-            packets = int(parts[1])
-            byte_count = int(parts[2])
-        except ValueError:
-            continue
-        stats[chain]["packets"] += packets
-        stats[chain]["bytes"] += byte_count
-        stats[chain]["rules"] += 1
+    for match in _RULE_STATS_RE.finditer(output):
+        chain_stats = stats[match.group(1)]
+        chain_stats["packets"] += int(match.group(2))
+        chain_stats["bytes"] += int(match.group(3))
+        chain_stats["rules"] += 1
     return stats
 
 
@@ -155,7 +152,6 @@ def apply_packet_loss(nodes: Iterable, probability: float) -> dict[str, Any]:
     probability_text = f"{probability:.6f}"
 
     target_nodes = list(nodes)
-    cleanup_packet_loss(target_nodes)
 
     commands = [
         (
@@ -174,9 +170,11 @@ def apply_packet_loss(nodes: Iterable, probability: float) -> dict[str, Any]:
         ),
     ]
 
+    # Clear old rules and install the new ones in a single round trip through
+    # each node's shell.
+    install_command = "; ".join([_cleanup_command(), *commands])
     for node in target_nodes:
-        for command in commands:
-            safe_node_cmd(node, command)
+        safe_node_cmd(node, install_command)
 
     stats = collect_packet_loss_stats(target_nodes)
     attempted_per_node = len(commands)
@@ -84,24 +84,26 @@ def stop(self) -> None:
             self._thread = None
 
     def _run(self, duration: float) -> None:
-        deadline = time.time() + duration
+        # Pacing runs on the monotonic clock so a wall-clock step cannot
+        # stretch the attack window or trigger a catch-up burst.
+        deadline = time.monotonic() + duration
         interval = 1.0 / self.rate
-        next_send = time.time()
+        next_send = time.monotonic()
         worker_count = self.max_workers or min(64, max(4, int(self.rate)))
         max_pending = max(worker_count * 2, 8)
 
         with ThreadPoolExecutor(max_workers=worker_count) as executor:
             pending: set[Future] = set()
-            while not self._stop.is_set() and time.time() < deadline:
+            while not self._stop.is_set() and time.monotonic() < deadline:
                 pending = {future for future in pending if not future.done()}
                 if len(pending) >= max_pending:
                     self._record_backpressure()
                     wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
                     continue
 
-                now = time.time()
+                now = time.monotonic()
                 if now < next_send:
-                    time.sleep(min(next_send - now, 0.01))
+                    self._stop.wait(min(next_send - now, 0.01))
                     continue
 
                 pair = self._next_payment_pair()
@@ -113,8 +115,8 @@ def _run(self, duration: float) -> None:
                     pending.add(executor.submit(self._submit_payment, sender_account, recipient_account))
 
                 next_send += interval
-                if next_send < time.time() - 1.0:
-                    next_send = time.time()
+                if next_send < time.monotonic() - 1.0:
+                    next_send = time.monotonic()
 
         self.runtime.record_event(
             {
@@ -5,8 +5,12 @@
 import hashlib
 import json
 import time
-from dataclasses import asdict, dataclass, field
-from typing import Any, Dict, List
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List
+
+# Shared encoder for bundle id preimages; json.dumps(..., sort_keys=True)
+# would construct a new one per call.
+_SORTED_JSON = json.JSONEncoder(sort_keys=True)
 
 
 @dataclass
@@ -37,31 +41,46 @@ def create(
         payload: Dict[str, Any],
         ttl: float = 300.0,
     ) -> "Bundle":
-        created_at = time.time()
+        return cls.create_many(src, [dst], payload, ttl)[0]
 
-        raw = json.dumps(
-            {
-                "src": src,
-                "dst": dst,
-                "payload": payload,
-                "created_at": created_at,
-            },
-            sort_keys=True,
-        ).encode("utf-8")
+    @classmethod
+    def create_many(
+        cls,
+        src: str,
+        dsts: Iterable[str],
+        payload: Dict[str, Any],
+        ttl: float = 300.0,
+    ) -> List["Bundle"]:
+        """Create one bundle per destination carrying the same *payload*.
 
-        bundle_id = hashlib.sha256(raw).hexdigest()[:24]
-        size_bytes = len(json.dumps(payload).encode("utf-8"))
+        The payload is serialised once and spliced into each bundle's id
+        preimage, instead of being re-encoded twice per destination.
+        """
+        created_at = time.time()
 
-        return cls(
-            bundle_id=bundle_id,
-            src=src,
-            dst=dst,
-            payload=payload,
-            created_at=created_at,
-            ttl=ttl,
-            hops=[src],
-            size_bytes=size_bytes,
-        )
+        payload_json = _SORTED_JSON.encode(payload)
+        size_bytes = len(payload_json.encode("utf-8"))
+        # Byte-for-byte json.dumps({"src", "dst", "payload", "created_at"},
+        # sort_keys=True) with only the destination left to fill in.
+        raw_prefix = f'{{"created_at": {json.dumps(created_at)}, "dst": '
+        raw_suffix = f', "payload": {payload_json}, "src": {json.dumps(src)}}}'
+
+        bundles = []
+        for dst in dsts:
+            raw = f"{raw_prefix}{json.dumps(dst)}{raw_suffix}".encode("utf-8")
+            bundles.append(
+                cls(
+                    bundle_id=hashlib.sha256(raw).hexdigest()[:24],
+                    src=src,
+                    dst=dst,
+                    payload=payload,
+                    created_at=created_at,
+                    ttl=ttl,
+                    hops=[src],
+                    size_bytes=size_bytes,
+                )
+            )
+        return bundles
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Bundle":
@@ -72,12 +91,25 @@ def from_dict(cls, data: Dict[str, Any]) -> "Bundle":
             payload=data["payload"],
             created_at=float(data["created_at"]),
             ttl=float(data["ttl"]),
-            hops=list(data.get("hops", [])),
+            # Wire dicts are freshly decoded and discarded, so the hop list
+            # is adopted rather than copied.
+            hops=data.get("hops") or [],
             size_bytes=int(data.get("size_bytes", 0)),
         )
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Built field by field: asdict() deep-copies the payload and hops on
+        # every send, but the result is only ever serialised straight away.
+        return {
+            "bundle_id": self.bundle_id,
+            "src": self.src,
+            "dst": self.dst,
+            "payload": self.payload,
+            "created_at": self.created_at,
+            "ttl": self.ttl,
+            "hops": self.hops,
+            "size_bytes": self.size_bytes,
+        }
 
     def expired(self, now: float | None = None) -> bool:
         current = time.time() if now is None else now
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""JSON encoding for DTN wire messages and DTN/MeshPay event logs.
+
+orjson is used when it is importable inside the node namespace; otherwise the
+stdlib encoder and decoder are used.  For JSON-native values (dicts with
+string or int keys, lists, str, int, float, bool, None) both paths emit compact
+UTF-8 text that either decoder reads back to the same values:
+
+* non-finite floats are written as ``null`` on both paths;
+* floats needing an exponent may be spelled differently (``1e16`` versus
+  ``1e+16``), so the bytes of such a document can differ;
+* orjson cannot represent integers outside the 64-bit range, so the encoders
+  hand those values to the stdlib, and :func:`loads` sends any document that
+  may contain one to the stdlib decoder, which keeps them exact.
+
+orjson also serialises types such as ``UUID`` and ``datetime`` natively while
+the stdlib raises ``TypeError``; callers pass JSON-native values only.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the host environment
+    orjson = None
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson else 0
+_ORJSON_SORTED_OPTIONS = (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS) if orjson else 0
+# allow_nan=False: orjson.loads rejects NaN/Infinity, so the stdlib must not
+# write them; _stdlib_encode() maps them to null the way orjson does.
+_STDLIB_ENCODER = json.JSONEncoder(
+    separators=(",", ":"), ensure_ascii=False, allow_nan=False
+)
+_STDLIB_SORTED_ENCODER = json.JSONEncoder(
+    separators=(",", ":"), ensure_ascii=False, sort_keys=True, allow_nan=False
+)
+# orjson.loads turns integers outside [-2**63, 2**64) into floats.  Any run of
+# 19 digits may be such an integer, so those documents go to the stdlib.
+_WIDE_INT_BYTES = re.compile(rb"[0-9]{19}")
+_WIDE_INT_TEXT = re.compile(r"[0-9]{19}")
+
+
+def _finite(obj: Any) -> Any:
+    """Return *obj* with non-finite floats replaced by ``None``."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+def _stdlib_encode(encoder: json.JSONEncoder, obj: Any) -> str:
+    try:
+        return encoder.encode(obj)
+    except ValueError:
+        # Non-finite floats (or a circular structure, which still fails);
+        # the copy is only made on this rare path.
+        return encoder.encode(_finite(obj))
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Encode ``obj`` as compact UTF-8 JSON for the wire."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # orjson rejects ints wider than 64 bits; the stdlib does not.
+            pass
+    return _stdlib_encode(_STDLIB_ENCODER, obj).encode("utf-8")
+
+
+def dumps_line(obj: Any) -> str:
+    """Encode ``obj`` as one sorted, compact JSON line (without newline)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_SORTED_OPTIONS).decode("utf-8")
+        except TypeError:
+            pass
+    return _stdlib_encode(_STDLIB_SORTED_ENCODER, obj)
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode one JSON document from ``str`` or UTF-8 ``bytes``."""
+    if orjson is not None:
+        wide_int = _WIDE_INT_TEXT if isinstance(data, str) else _WIDE_INT_BYTES
+        if wide_int.search(data) is None:
+            return orjson.loads(data)
+    return json.loads(data)
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import heapq
 import threading
 import time
-from typing import Any, List, Optional, Set
+from typing import List, Optional, Set
 
 from dtn.bundle import Bundle
 from dtn.router import DTNRouter, inject_bundle, parse_args
@@ -206,7 +207,11 @@ def select_bundles_for_peer(
                         direct,
                     ))
 
-            selected = sorted(selected, key=lambda item: item[0])[: self.max_bundles_per_exchange]
+            # Only the earliest max_bundles_per_exchange are sent; a bounded
+            # heap selects them without sorting every forwardable bundle.
+            selected = heapq.nsmallest(
+                self.max_bundles_per_exchange, selected, key=lambda item: item[0]
+            )
             bundles: List[Bundle] = []
 
             for _created_at, bundle, local_score, peer_score, direct in selected:
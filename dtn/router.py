@@ -19,7 +19,8 @@
 
 from dtn import config
 from dtn.bundle import Bundle
-from dtn.store import BundleStore
+from dtn.jsoncodec import dumps_bytes, dumps_line, loads
+from dtn.store import SUPERSEDED_PAYLOAD_TYPES, BundleStore
 
 
 # ---------------------------------------------------------------------------
@@ -35,6 +36,9 @@
 # Only use the compressed form when it is meaningfully smaller.
 _COMPRESS_MIN_RATIO: float = 0.90
 
+# json.dumps() string escaping, for the hand-rendered discovery datagrams.
+_json_str = json.encoder.encode_basestring_ascii
+
 # Hard cap on the seen-nonces dict.
 _NONCE_DICT_MAX:     int = 1_000
 _NONCE_DICT_EVICT_TO: int = 500
@@ -51,7 +55,7 @@ def _encode_message(msg: dict) -> str:
     Larger messages are zlib-compressed (level 1) and base64-encoded, but only
     when compression actually shrinks the payload.
     """
-    raw = json.dumps(msg).encode("utf-8")
+    raw = dumps_bytes(msg)
     if len(raw) > _COMPRESS_THRESHOLD_BYTES:
         compressed = zlib.compress(raw, level=1)
         if len(compressed) < len(raw) * _COMPRESS_MIN_RATIO:
@@ -66,14 +70,14 @@ def _decode_message(line: str) -> dict:
         return {}
     if line.startswith("{"):
         try:
-            return json.loads(line)
+            return loads(line)
         except Exception:
             return {}
     try:
-        return json.loads(zlib.decompress(base64.b64decode(line.encode("ascii"))).decode("utf-8"))
+        return loads(zlib.decompress(base64.b64decode(line.encode("ascii"))))
     except Exception:
         try:
-            return json.loads(line)
+            return loads(line)
         except Exception:
             return {}
 
@@ -132,6 +136,15 @@ def __init__(
         self.discovery_mode   = discovery_mode
         self.wireless_iface   = wireless_iface or f"{self.node}-wlan0"
         self.running          = True
+        self._log_prefix      = f"[{self.node}] "
+
+        # Discovery datagrams have a fixed shape in which only the nonce and
+        # timestamp vary, so the constant JSON around them is rendered once.
+        # The result is byte-identical to json.dumps() of the message dict.
+        node_fields = f'"node": {_json_str(self.node)}, "exchange_port": {self.exchange_port}'
+        self._discover_prefix = f'{{"type": "discover", {node_fields}, "nonce": '
+        self._discover_suffix = f', "discovery_mode": {_json_str(self.discovery_mode)}}}'
+        self._peer_reply_prefix = f'{{"type": "peer", {node_fields}, "nonce": '
 
         # Mesh needs more headroom for connect/socket/backoff due to emulation
         # load — but we no longer clamp success_cooldown, which was causing
@@ -178,6 +191,11 @@ def __init__(
             if clean_mac:
                 self.peers_by_mac[clean_mac] = (peer_node, peer_ip)
 
+        # The static peer table never changes after start-up; keep the views
+        # the discovery loops need instead of rebuilding them every round.
+        self._static_peer_ips:   List[str] = [ip for ip, _mac in self.static_peers.values()]
+        self._static_peer_names: List[str] = sorted(self.static_peers)
+
         # ---- mesh-specific state ------------------------------------------
         self.mesh_probe_peers_per_round   = max(6, self.max_parallel_exchanges * 2)
         self.mesh_exchange_peers_per_tick = max(1, self.max_parallel_exchanges)
@@ -201,14 +219,17 @@ def _normalize_mac(mac: str | None) -> str | None:
     # ------------------------------------------------------------------
 
     def log(self, message: str) -> None:
-        entry = {"time": time.time(), "node": self.node, "event": "router_log", "message": message}
-        print(f"[{self.node}] {message}", flush=True)
-        self.store.record_event(entry)
+        print(self._log_prefix + message, flush=True)
+        # record_event() adds the time and node only if the event is kept.
+        self.record_event({"event": "router_log", "message": message})
 
     def record_event(self, event: dict) -> None:
-        event = dict(event)
-        event.setdefault("time", time.time())
-        event.setdefault("node", self.node)
+        # With the default store settings most events are only counted, so
+        # they are copied and stamped only when something will read them.
+        if self.store.keeps_event(event.get("event")):
+            event = dict(event)
+            event.setdefault("time", time.time())
+            event.setdefault("node", self.node)
         self.store.record_event(event)
 
     # ------------------------------------------------------------------
@@ -303,7 +324,7 @@ def remember_bundle(self, bundle: Bundle) -> bool:
         # Vaccine pruning: drop superseded transfer/signed bundles.
         if isinstance(bundle.payload, dict):
             ptype = bundle.payload.get("type")
-            if ptype in {"transfer_order", "signed_transfer_order"}:
+            if ptype in SUPERSEDED_PAYLOAD_TYPES:
                 order_id = (
                     bundle.payload.get("data", {}).get("order_id")
                     or bundle.payload.get("data", {}).get("i")
@@ -505,7 +526,7 @@ def _emit_delivery_event(self, bundle: Bundle) -> None:
             with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
                 conn.settimeout(2.0)
                 conn.connect(str(self.delivery_socket))
-                conn.sendall((json.dumps(event, separators=(",", ":"), sort_keys=True) + "\n").encode("utf-8"))
+                conn.sendall((dumps_line(event) + "\n").encode("utf-8"))
             self.record_event({
                 "event": "delivery_event_sent",
                 "bundle_id": bundle.bundle_id,
@@ -979,15 +1000,10 @@ def _prune_seen_discovery_nonces(self) -> None:
 
     def _send_discovery_request(self, send_sock: socket.socket, targets: List[str]) -> None:
         nonce   = str(uuid.uuid4())
-        message = {
-            "type":           "discover",
-            "node":           self.node,
-            "exchange_port":  self.exchange_port,
-            "nonce":          nonce,
-            "time":           time.time(),
-            "discovery_mode": self.discovery_mode,
-        }
-        encoded = json.dumps(message).encode("utf-8")
+        encoded = (
+            f'{self._discover_prefix}{_json_str(nonce)}, "time": {time.time()!r}'
+            f'{self._discover_suffix}'
+        ).encode("utf-8")
         sent = failed = 0
         for target in targets:
             try:
@@ -999,15 +1015,10 @@ def _send_discovery_request(self, send_sock: socket.socket, targets: List[str])
         self.record_event({"event": "discovery_request_sent", "targets": targets, "sent": sent, "failed": failed, "nonce": nonce})
 
     def _send_peer_reply(self, send_sock: socket.socket, dst_ip: str, nonce: str | None) -> None:
-        message = {
-            "type":          "peer",
-            "node":          self.node,
-            "exchange_port": self.exchange_port,
-            "nonce":         nonce,
-            "time":          time.time(),
-        }
+        nonce_json = _json_str(nonce) if isinstance(nonce, str) else json.dumps(nonce)
+        encoded = f'{self._peer_reply_prefix}{nonce_json}, "time": {time.time()!r}}}'.encode("utf-8")
         try:
-            send_sock.sendto(json.dumps(message).encode("utf-8"), (dst_ip, self.discovery_port))
+            send_sock.sendto(encoded, (dst_ip, self.discovery_port))
             self.record_event({"event": "peer_reply_sent", "dst_ip": dst_ip, "nonce": nonce})
         except Exception as exc:
             self.record_event({"event": "peer_reply_failed", "dst_ip": dst_ip, "nonce": nonce, "error": repr(exc)})
@@ -1105,11 +1116,7 @@ def _adhoc_discovery_loop(self) -> None:
 
             if now >= next_discovery:
                 self._prune_seen_discovery_nonces()
-                static_ips = [
-                    ip for node, (ip, _mac) in self.static_peers.items()
-                    if node != self.node
-                ]
-                self._send_discovery_request(send_sock, broadcasts + static_ips)
+                self._send_discovery_request(send_sock, broadcasts + self._static_peer_ips)
                 next_discovery = now + self.discovery_interval + random.uniform(0.0, self.discovery_interval * 0.25)
 
             # Check for new bundles BEFORE blocking on recvfrom so the push
@@ -1120,7 +1127,7 @@ def _adhoc_discovery_loop(self) -> None:
 
             try:
                 data, addr = recv_sock.recvfrom(4096)
-                self._handle_discovery_message(json.loads(data.decode("utf-8")), addr, send_sock)
+                self._handle_discovery_message(loads(data), addr, send_sock)
             except socket.timeout:
                 pass
             except Exception:
@@ -1194,17 +1201,22 @@ def _select_mesh_probe_peers(self, station_peers: Set[str]) -> List[str]:
             node for node, (_ip, _port, seen) in self.mesh_reachable_peers.items()
             if now - seen < self.mesh_peer_ttl
         }
-        priority = (set(station_peers) | recently_reachable) & set(self.static_peers)
-        selected = [n for n in sorted(priority) if n != self.node]
-
-        all_known = sorted(self.static_peers)
+        # Union the sets in place and intersect with the static-peer keys view:
+        # no copies of station_peers or static_peers per discovery round.
+        recently_reachable |= station_peers
+        priority = self.static_peers.keys() & recently_reachable
+        priority.discard(self.node)
+        selected = sorted(priority)
+
+        all_known = self._static_peer_names
         target    = max(self.mesh_probe_peers_per_round, len(selected))
         attempts  = 0
         while len(selected) < target and attempts < len(all_known):
             peer_node = all_known[self._mesh_probe_cursor % len(all_known)]
             self._mesh_probe_cursor += 1
             attempts += 1
-            if peer_node not in selected and peer_node != self.node:
+            if peer_node not in priority and peer_node != self.node:
+                priority.add(peer_node)
                 selected.append(peer_node)
         return selected
 
@@ -1368,7 +1380,7 @@ def _mesh_discovery_loop(self) -> None:
 
             try:
                 data, addr = recv_sock.recvfrom(4096)
-                self._handle_discovery_message(json.loads(data.decode("utf-8")), addr, send_sock)
+                self._handle_discovery_message(loads(data), addr, send_sock)
             except socket.timeout:
                 pass
             except Exception:
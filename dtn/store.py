@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import heapq
-import json
 import os
 import threading
 import time
@@ -11,6 +10,7 @@
 from typing import Iterable, List, Optional
 
 from dtn.bundle import Bundle
+from dtn.jsoncodec import dumps_line
 
 
 _METRIC_EVENTS = {
@@ -25,6 +25,16 @@
     "incoming_contact_missed",
 }
 
+# Payload types superseded once a confirmation for the same order exists.
+SUPERSEDED_PAYLOAD_TYPES = frozenset({"transfer_order", "signed_transfer_order"})
+
+# Exchange priority: confirmations first, then signatures, then new orders.
+_PAYLOAD_TYPE_RANK = {
+    "confirmation_order": 0,
+    "signed_transfer_order": 1,
+    "transfer_order": 2,
+}
+
 
 def _env_true(name: str, default: bool = False) -> bool:
     value = os.environ.get(name)
@@ -151,11 +161,7 @@ def unknown_to_peer(
 
         def priority(bundle: Bundle) -> tuple[int, int, float]:
             ptype = self._payload_type(bundle)
-            type_rank = {
-                "confirmation_order": 0,
-                "signed_transfer_order": 1,
-                "transfer_order": 2,
-            }.get(ptype, 3)
+            type_rank = _PAYLOAD_TYPE_RANK.get(ptype, 3)
             dst_rank = 0 if peer_node and bundle.dst == peer_node else 1
             return type_rank, dst_rank, bundle.created_at
 
@@ -190,7 +196,7 @@ def mark_delivered(self, bundle: Bundle, node: str) -> bool:
             try:
                 self.delivered_log.parent.mkdir(parents=True, exist_ok=True)
                 with self.delivered_log.open("a", encoding="utf-8") as f:
-                    f.write(json.dumps(event, sort_keys=True) + "\n")
+                    f.write(dumps_line(event) + "\n")
                 with self._lock:
                     self.diagnostics["delivered_written"] += 1
             except Exception:
@@ -199,8 +205,22 @@ def mark_delivered(self, bundle: Bundle, node: str) -> bool:
         self.record_event(event)
         return True
 
+    def keeps_event(self, name: Optional[str]) -> bool:
+        """Return whether an event called *name* is kept in memory or logged."""
+        if self.max_events > 0:
+            return True
+        if not self._write_event_log:
+            return False
+        return self._event_filter != "metrics" or name in _METRIC_EVENTS
+
     def record_event(self, event: dict) -> None:
         """Record an in-memory event and optionally append cold debug metrics."""
+        if not self.keeps_event(event.get("event")):
+            # Filtered out everywhere: count it, but skip the copy and stamp.
+            with self._lock:
+                self.diagnostics["events_recorded"] += 1
+            return
+
         event = dict(event)
         event.setdefault("time", time.time())
 
@@ -218,7 +238,7 @@ def record_event(self, event: dict) -> None:
         try:
             self.events_log.parent.mkdir(parents=True, exist_ok=True)
             with self.events_log.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(event, sort_keys=True) + "\n")
+                f.write(dumps_line(event) + "\n")
             with self._lock:
                 self.diagnostics["events_written"] += 1
         except Exception:
@@ -253,7 +273,7 @@ def _prune_by_order_id_unlocked(self, order_id: str) -> None:
         to_delete = [
             bid
             for bid, bundle in self._bundles.items()
-            if self._payload_type(bundle) in {"transfer_order", "signed_transfer_order"}
+            if self._payload_type(bundle) in SUPERSEDED_PAYLOAD_TYPES
             and self._order_id_for_bundle(bundle) == str(order_id)
         ]
         for bid in to_delete:
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Bundle id and wire round-trip tests for dtn.bundle."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import unittest
+from unittest import mock
+
+from dtn import jsoncodec
+from dtn.bundle import Bundle
+
+CREATED_AT = 1792120542.6146655
+PAYLOADS = [
+    {},
+    {"type": "transfer_order", "v": 3, "data": {"i": "ab" * 16, "a": 5, "t": CREATED_AT}},
+    {"z": [1, 2.5, None, True], "a": {"nested": {"é": " \"quoted\"\\"}}},
+]
+
+
+def legacy_bundle_id(src: str, dst: str, payload: dict, created_at: float) -> str:
+    """The id preimage used before ids were spliced from a shared payload."""
+    raw = json.dumps(
+        {"src": src, "dst": dst, "payload": payload, "created_at": created_at},
+        sort_keys=True,
+    ).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()[:24]
+
+
+class TestBundleIds(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch("dtn.bundle.time")
+        patcher.start().time.return_value = CREATED_AT
+        self.addCleanup(patcher.stop)
+
+    def test_create_matches_legacy_preimage(self):
+        for payload in PAYLOADS:
+            bundle = Bundle.create("sta1", "sta2", payload, ttl=60.0)
+            self.assertEqual(bundle.bundle_id, legacy_bundle_id("sta1", "sta2", payload, CREATED_AT))
+            self.assertEqual(bundle.size_bytes, len(json.dumps(payload).encode("utf-8")))
+            self.assertEqual(bundle.hops, ["sta1"])
+
+    def test_create_many_matches_legacy_preimage(self):
+        dsts = ["sta2", "auth1", "ap-\"1\"", "stä3"]
+        for payload in PAYLOADS:
+            bundles = Bundle.create_many("sta1", dsts, payload)
+            self.assertEqual([b.dst for b in bundles], dsts)
+            for bundle in bundles:
+                self.assertEqual(
+                    bundle.bundle_id,
+                    legacy_bundle_id("sta1", bundle.dst, payload, CREATED_AT),
+                )
+            self.assertEqual(len({b.bundle_id for b in bundles}), len(dsts))
+
+    def test_create_many_does_not_share_hop_lists(self):
+        first, second = Bundle.create_many("sta1", ["sta2", "sta3"], PAYLOADS[1])
+        first.add_hop("sta4")
+        self.assertEqual(second.hops, ["sta1"])
+
+
+class TestBundleDicts(unittest.TestCase):
+    def test_wire_round_trip(self):
+        bundle = Bundle.create("sta1", "sta2", PAYLOADS[2], ttl=45.0)
+        bundle.add_hop("sta5")
+        decoded = Bundle.from_dict(jsoncodec.loads(jsoncodec.dumps_bytes(bundle.to_dict())))
+        self.assertEqual(decoded, bundle)
+
+    def test_to_dict_matches_field_layout(self):
+        bundle = Bundle.create("sta1", "sta2", PAYLOADS[1])
+        self.assertEqual(
+            list(bundle.to_dict()),
+            ["bundle_id", "src", "dst", "payload", "created_at", "ttl", "hops", "size_bytes"],
+        )
+
+    def test_from_dict_defaults(self):
+        data = Bundle.create("sta1", "sta2", {}).to_dict()
+        del data["hops"], data["size_bytes"]
+        bundle = Bundle.from_dict(data)
+        self.assertEqual(bundle.hops, [])
+        self.assertEqual(bundle.size_bytes, 0)
+        self.assertEqual(Bundle.from_dict(dict(data, hops=None)).hops, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
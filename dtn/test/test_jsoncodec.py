@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Round-trip tests for dtn.jsoncodec with and without orjson."""
+
+from __future__ import annotations
+
+import json
+import unittest
+from unittest import mock
+
+from dtn import jsoncodec
+
+SAMPLE = {
+    "type": "bundle_batch",
+    "bundles": [{"id": "b1", "payload": {"amount": 5, "memo": "café  "}}],
+    "ttl": 30.5,
+    "ok": True,
+    "none": None,
+}
+WIDE_INTS = [2**70, -(2**70), -(10**19 - 1), 2**64 - 1, -(2**63), 10**19 + 7]
+
+
+class JsonCodecCommon:
+    """Shared checks, run once per encoder/decoder backend."""
+
+    def test_dumps_bytes_round_trip(self):
+        self.assertEqual(jsoncodec.loads(jsoncodec.dumps_bytes(SAMPLE)), SAMPLE)
+
+    def test_dumps_line_round_trip(self):
+        line = jsoncodec.dumps_line(SAMPLE)
+        self.assertNotIn("\n", line)
+        self.assertEqual(jsoncodec.loads(line), SAMPLE)
+        self.assertEqual(json.loads(line), SAMPLE)
+
+    def test_dumps_line_is_sorted_and_compact(self):
+        self.assertEqual(jsoncodec.dumps_line({"b": 1, "a": [1, 2]}), '{"a":[1,2],"b":1}')
+
+    def test_dumps_line_accepts_wide_ints(self):
+        self.assertEqual(json.loads(jsoncodec.dumps_line({"a": 2**70})), {"a": 2**70})
+
+    def test_output_matches_stdlib_utf8(self):
+        expected = json.dumps(SAMPLE, separators=(",", ":"), ensure_ascii=False)
+        self.assertEqual(jsoncodec.dumps_bytes(SAMPLE), expected.encode("utf-8"))
+        self.assertEqual(
+            jsoncodec.dumps_line(SAMPLE),
+            json.dumps(SAMPLE, separators=(",", ":"), ensure_ascii=False, sort_keys=True),
+        )
+
+    def test_wide_ints_stay_exact(self):
+        for value in WIDE_INTS:
+            for encode in (jsoncodec.dumps_bytes, jsoncodec.dumps_line):
+                decoded = jsoncodec.loads(encode({"a": value}))["a"]
+                self.assertIs(type(decoded), int)
+                self.assertEqual(decoded, value)
+        self.assertEqual(jsoncodec.loads(bytearray(jsoncodec.dumps_bytes({"a": 2**70}))), {"a": 2**70})
+
+    def test_non_finite_floats_become_null(self):
+        value = {"a": [float("nan"), float("inf")], "b": {"c": -float("inf")}, "d": 1.5}
+        expected = {"a": [None, None], "b": {"c": None}, "d": 1.5}
+        self.assertEqual(jsoncodec.loads(jsoncodec.dumps_bytes(value)), expected)
+        self.assertEqual(jsoncodec.loads(jsoncodec.dumps_line(value)), expected)
+        self.assertNotIn(b"NaN", jsoncodec.dumps_bytes(value))
+        self.assertNotIn("Infinity", jsoncodec.dumps_line(value))
+
+    def test_loads_accepts_str_bytes_and_bytearray(self):
+        raw = jsoncodec.dumps_bytes({"a": 1, "b": "x"})
+        for data in (raw, raw.decode("utf-8"), bytearray(raw)):
+            self.assertEqual(jsoncodec.loads(data), {"a": 1, "b": "x"})
+
+
+@unittest.skipUnless(jsoncodec.orjson, "orjson is not installed")
+class TestJsonCodecOrjson(JsonCodecCommon, unittest.TestCase):
+    """Codec backed by orjson."""
+
+
+class TestJsonCodecStdlib(JsonCodecCommon, unittest.TestCase):
+    """Codec with orjson unavailable."""
+
+    def setUp(self):
+        patcher = mock.patch.object(jsoncodec, "orjson", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+@unittest.skipUnless(jsoncodec.orjson, "orjson is not installed")
+class TestJsonCodecInterop(unittest.TestCase):
+    """Bytes written by one backend decode identically with the other."""
+
+    def test_backends_decode_each_other(self):
+        orjson_bytes = jsoncodec.dumps_bytes(SAMPLE)
+        with mock.patch.object(jsoncodec, "orjson", None):
+            stdlib_bytes = jsoncodec.dumps_bytes(SAMPLE)
+            self.assertEqual(jsoncodec.loads(orjson_bytes), SAMPLE)
+        self.assertEqual(jsoncodec.loads(stdlib_bytes), SAMPLE)
+
+    def test_backends_agree(self):
+        orjson_bytes = jsoncodec.dumps_bytes(SAMPLE)
+        orjson_line = jsoncodec.dumps_line(SAMPLE)
+        with mock.patch.object(jsoncodec, "orjson", None):
+            self.assertEqual(jsoncodec.dumps_bytes(SAMPLE), orjson_bytes)
+            self.assertEqual(jsoncodec.dumps_line(SAMPLE), orjson_line)
+            stdlib_bytes = jsoncodec.dumps_bytes({"a": 2**70})
+        self.assertEqual(jsoncodec.loads(stdlib_bytes), {"a": 2**70})
+
+    def test_backends_agree_on_non_finite_floats(self):
+        value = {"a": float("nan"), "b": [float("-inf"), 2.5]}
+        orjson_bytes = jsoncodec.dumps_bytes(value)
+        orjson_line = jsoncodec.dumps_line(value)
+        with mock.patch.object(jsoncodec, "orjson", None):
+            stdlib_bytes = jsoncodec.dumps_bytes(value)
+            self.assertEqual(stdlib_bytes, orjson_bytes)
+            self.assertEqual(jsoncodec.dumps_line(value), orjson_line)
+        self.assertEqual(jsoncodec.loads(stdlib_bytes), {"a": None, "b": [None, 2.5]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -40,6 +40,23 @@
     "prophet": DTN_DIR / "prophet.py",
 }
 
+READY_BANNER = (
+    "\n*** MeshPay offline interactive demo is ready\n"
+    "*** Physical payment:      pay sta1 sta3 10\n"
+    "*** Alternative command:   sta1 pay sta3 10\n"
+    "*** Virtual payment:       vpay sta1/u00001 sta3/u00001 10\n"
+    "*** Show accounts:         accounts\n"
+    "*** Show node accounts:    accounts sta1\n"
+    "*** Show balances:         balance\n"
+    "*** Show one balance:      balance sta1\n"
+    "*** Show payments:         payments\n"
+    "*** Show payment metrics:  metrics\n"
+    "*** Show payment log:      paymentlog\n"
+    "*** Show DTN logs:         dtnlog\n"
+    "*** Show delivered:        delivered\n"
+    "*** Logs directory:        {log_dir}\n\n"
+)
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -349,17 +366,16 @@ def station_params(
     ip: str,
     args: argparse.Namespace,
 ) -> dict:
-    x = 10 + ((node_index - 1) * args.station_spacing)
-    y = 10
-    fixed_position = f"{x:.2f},{y:.2f},0"
-
     params = {
         "ip": ip,
         "range": args.node_range,
     }
 
     if args.no_mobility:
-        params["position"] = fixed_position
+        # Simple deterministic layout, only needed when stations stay put.
+        x = 10 + ((node_index - 1) * args.station_spacing)
+        y = 10
+        params["position"] = f"{x:.2f},{y:.2f},0"
     else:
         params.update(
             {
@@ -511,20 +527,7 @@ def topology(args: argparse.Namespace) -> None:
 
         runtime.start()
 
-        info("\n*** MeshPay offline interactive demo is ready\n")
-        info("*** Physical payment:      pay sta1 sta3 10\n")
-        info("*** Alternative command:   sta1 pay sta3 10\n")
-        info("*** Virtual payment:       vpay sta1/u00001 sta3/u00001 10\n")
-        info("*** Show accounts:         accounts\n")
-        info("*** Show node accounts:    accounts sta1\n")
-        info("*** Show balances:         balance\n")
-        info("*** Show one balance:      balance sta1\n")
-        info("*** Show payments:         payments\n")
-        info("*** Show payment metrics:  metrics\n")
-        info("*** Show payment log:      paymentlog\n")
-        info("*** Show DTN logs:         dtnlog\n")
-        info("*** Show delivered:        delivered\n")
-        info(f"*** Logs directory:        {log_dir}\n\n")
+        info(READY_BANNER.format(log_dir=log_dir))
 
         MeshPayCLI(
             net,
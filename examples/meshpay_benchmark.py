@@ -6,6 +6,7 @@
 import json
 import os
 import random
+import re
 import shutil
 import sys
 import threading
@@ -37,6 +38,7 @@
 from meshpay.benchmark.network_metrics import collect_network_metrics
 from meshpay.benchmark.report import write_reports
 from meshpay.cli.meshpay_cli import MeshPayRuntime
+from meshpay.mininet_cmd import safe_node_cmd
 from meshpay.offline.nodes.authority import Authority
 from meshpay.offline.nodes.client import Client
 from meshpay.offline.virtual_accounts import make_account_id
@@ -50,6 +52,59 @@
     "prophet": ROOT_DIR / "dtn" / "prophet.py",
 }
 
+
+# "<iface>: rx_bytes rx_packets rx_errs rx_drop ... tx_bytes tx_packets
+# tx_errs tx_drop ..." -- the fields NetworkStatsCollector reports.
+_PROC_NET_DEV_RE = re.compile(
+    r"^\s*(?P<iface>[^\s:]+):\s*"
+    r"(?P<rx_bytes>\d+)\s+(?P<rx_packets>\d+)\s+(?P<rx_errs>\d+)\s+(?P<rx_drop>\d+)"
+    r"(?:\s+\d+){4}\s+"
+    r"(?P<tx_bytes>\d+)\s+(?P<tx_packets>\d+)\s+(?P<tx_errs>\d+)\s+(?P<tx_drop>\d+)",
+    re.MULTILINE,
+)
+
+
+# Fixed layouts of the print_summary() report.
+SUMMARY_PAYMENTS_TMPL = (
+    "\n*** MeshPay payment benchmark summary\n"
+    "payments_created:                  {payments_created}\n"
+    "payments_confirmed:                {payments_confirmed}\n"
+    "payments_unconfirmed:              {payments_unconfirmed}\n"
+    "payments_accepted:                 {payments_accepted}\n"
+    "payments_unaccepted:               {payments_unaccepted}\n"
+    "payment_acceptance_rate_percent:   {payment_acceptance_rate_percent:.2f}%\n"
+    "created_tps:                       {created_tps:.4f}\n"
+    "confirmed_tps:                     {confirmed_tps:.4f}\n"
+    "accepted_tps:                      {accepted_tps:.4f}\n"
+)
+SUMMARY_NETWORK_TMPL = (
+    "tx_packets_per_second:             {tx_packets_rate:.4f}\n"
+    "rx_packets_per_second:             {rx_packets_rate:.4f}\n"
+    "tx_plus_rx_packets_per_second:     {tx_plus_rx_packets_rate:.4f}\n"
+    "tx_bytes_per_second:               {tx_bytes_rate:.4f}\n"
+    "rx_bytes_per_second:               {rx_bytes_rate:.4f}\n"
+    "tx_plus_rx_bytes_per_second:       {tx_plus_rx_bytes_rate:.4f}\n"
+)
+SUMMARY_NETWORK_RATES = (
+    "tx_packets_rate",
+    "rx_packets_rate",
+    "tx_plus_rx_packets_rate",
+    "tx_bytes_rate",
+    "rx_bytes_rate",
+    "tx_plus_rx_bytes_rate",
+)
+SUMMARY_QUORUM_TMPL = (
+    "avg_time_to_quorum_ms: {avg:.4f}\n"
+    "p50_time_to_quorum_ms: {p50:.4f}\n"
+    "p95_time_to_quorum_ms: {p95:.4f}\n"
+)
+SUMMARY_ACCEPTANCE_TMPL = (
+    "avg_time_to_acceptance_ms: {avg:.4f}\n"
+    "p50_time_to_acceptance_ms: {p50:.4f}\n"
+    "p95_time_to_acceptance_ms: {p95:.4f}\n"
+)
+
+
 @dataclass(frozen=True)
 class MeshPayBenchmarkConfig:
     routing: str
@@ -647,6 +702,8 @@ def configure_mobility(
         max_y=config.area_height,
         seed=config.seed,
     )
+
+
 class NetworkStatsCollector(threading.Thread):
     def __init__(self, runtime: MeshPayRuntime, nodes, interval: float = 5.0):
         super().__init__(name="NetworkStatsCollector")
@@ -657,38 +714,31 @@ def __init__(self, runtime: MeshPayRuntime, nodes, interval: float = 5.0):
         self.daemon = True
 
     def _parse_dev_line(self, raw_output: str, iface: str) -> dict[str, int] | None:
-        for line in raw_output.splitlines():
-            if iface not in line:
-                continue
-            if ":" not in line:
-                continue
-            try:
-                parts = line.split(":", 1)[1].split()
-                if len(parts) >= 12:
-                    return {
-                        "rx_bytes": int(parts[0]),
-                        "rx_packets": int(parts[1]),
-                        "rx_errs": int(parts[2]),
-                        "rx_drop": int(parts[3]),
-                        "tx_bytes": int(parts[8]),
-                        "tx_packets": int(parts[9]),
-                        "tx_errs": int(parts[10]),
-                        "tx_drop": int(parts[11]),
-                    }
-            except (ValueError, IndexError):
-                pass
+        for match in _PROC_NET_DEV_RE.finditer(raw_output):
+            if match["iface"] == iface:
+                stats = match.groupdict()
+                del stats["iface"]
+                return {key: int(value) for key, value in stats.items()}
         return None
 
-    def run(self) -> None:
-        from meshpay.mininet_cmd import safe_node_cmd
+    def _read_dev(self, node, iface: str) -> str:
+        # /proc/<pid>/net/dev reflects the network namespace of that process,
+        # so the host can read every station's counters directly instead of
+        # forking a shell inside each node.
+        pid = getattr(node, "pid", None)
+        if pid:
+            try:
+                return Path(f"/proc/{pid}/net/dev").read_text(encoding="utf-8")
+            except OSError:
+                pass
+        return safe_node_cmd(node, f"cat /proc/net/dev | grep {iface}")
 
-        # First collection immediately
+    def _collect_once(self) -> None:
         timestamp = time.time()
         for node in self.nodes:
             iface = node.params.get("wlan", [f"{node.name}-wlan0"])[0]
             try:
-                res = safe_node_cmd(node, f"cat /proc/net/dev | grep {iface}")
-                stats = self._parse_dev_line(res, iface)
+                stats = self._parse_dev_line(self._read_dev(node, iface), iface)
                 if stats:
                     self.runtime.record_event(
                         {
@@ -701,49 +751,33 @@ def run(self) -> None:
             except Exception:
                 pass
 
-        # Subsequent collections every interval
+    def run(self) -> None:
+        # First collection immediately, then every interval
+        self._collect_once()
         while not self.stop_event.wait(self.interval):
-            timestamp = time.time()
-            for node in self.nodes:
-                iface = node.params.get("wlan", [f"{node.name}-wlan0"])[0]
-                try:
-                    res = safe_node_cmd(node, f"cat /proc/net/dev | grep {iface}")
-                    stats = self._parse_dev_line(res, iface)
-                    if stats:
-                        self.runtime.record_event(
-                            {
-                                "event": "network_stats",
-                                "node": node.name,
-                                "time": timestamp,
-                                **stats,
-                            }
-                        )
-                except Exception:
-                    pass
+            self._collect_once()
 
     def stop(self) -> None:
         self.stop_event.set()
-        from meshpay.mininet_cmd import safe_node_cmd
-        timestamp = time.time()
-        for node in self.nodes:
-            iface = node.params.get("wlan", [f"{node.name}-wlan0"])[0]
-            try:
-                res = safe_node_cmd(node, f"cat /proc/net/dev | grep {iface}")
-                stats = self._parse_dev_line(res, iface)
-                if stats:
-                    self.runtime.record_event(
-                        {
-                            "event": "network_stats",
-                            "node": node.name,
-                            "time": timestamp,
-                            **stats,
-                        }
-                    )
-            except Exception:
-                pass
+        self._collect_once()
         self.join(timeout=2.0)
 
 
+# Interface counters sampled by RawNetworkStatsCollector, in the order they
+# are read from /sys/class/net/<iface>/statistics.
+RAW_STAT_FIELDS = (
+    "rx_bytes",
+    "tx_bytes",
+    "rx_packets",
+    "tx_packets",
+    "rx_dropped",
+    "tx_dropped",
+    "rx_errors",
+    "tx_errors",
+)
+RAW_STATS_WORKERS = 8
+
+
 class RawNetworkStatsCollector(threading.Thread):
     def __init__(self, log_dir: Path | str, nodes, interval: float = 1.0, benchmark_started_at: float = 0.0):
         super().__init__(name="RawNetworkStatsCollector")
@@ -754,43 +788,47 @@ def __init__(self, log_dir: Path | str, nodes, interval: float = 1.0, benchmark_
         self.stop_event = threading.Event()
         self.daemon = True
         self.output_file = self.log_dir / "network_raw.jsonl"
+        # (name, iface, command) per node; none of it changes between samples.
+        self._targets = []
+        for node in nodes:
+            iface = node.params.get("wlan", [f"{node.name}-wlan0"])[0]
+            stats_dir = f"/sys/class/net/{iface}/statistics"
+            cmd = "cat " + " ".join(f"{stats_dir}/{field}" for field in RAW_STAT_FIELDS)
+            self._targets.append((node, iface, cmd))
+        # Each node has its own command lock, so the per-node reads of one
+        # sample can overlap instead of queueing behind each other.
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, min(RAW_STATS_WORKERS, len(self._targets))),
+            thread_name_prefix="raw-network-stats",
+        )
+
+    def _read_counters(self, target) -> list[int] | None:
+        node, _iface, cmd = target
+        try:
+            lines = safe_node_cmd(node, cmd).strip().splitlines()
+            if len(lines) == len(RAW_STAT_FIELDS):
+                return [int(line) for line in lines]
+        except Exception:
+            pass
+        return None
 
     def _collect_once(self) -> None:
-        from meshpay.mininet_cmd import safe_node_cmd
         timestamp = time.time()
         relative_timestamp = timestamp - self.benchmark_started_at
         
         records = []
-        for node in self.nodes:
-            iface = node.params.get("wlan", [f"{node.name}-wlan0"])[0]
-            try:
-                cmd = f"cat /sys/class/net/{iface}/statistics/rx_bytes " \
-                      f"/sys/class/net/{iface}/statistics/tx_bytes " \
-                      f"/sys/class/net/{iface}/statistics/rx_packets " \
-                      f"/sys/class/net/{iface}/statistics/tx_packets " \
-                      f"/sys/class/net/{iface}/statistics/rx_dropped " \
-                      f"/sys/class/net/{iface}/statistics/tx_dropped " \
-                      f"/sys/class/net/{iface}/statistics/rx_errors " \
-                      f"/sys/class/net/{iface}/statistics/tx_errors"
-                res = safe_node_cmd(node, cmd)
-                lines = res.strip().splitlines()
-                if len(lines) == 8:
-                    records.append({
-                        "node": node.name,
-                        "iface": iface,
-                        "time": timestamp,
-                        "relative_time_s": relative_timestamp,
-                        "rx_bytes": int(lines[0]),
-                        "tx_bytes": int(lines[1]),
-                        "rx_packets": int(lines[2]),
-                        "tx_packets": int(lines[3]),
-                        "rx_dropped": int(lines[4]),
-                        "tx_dropped": int(lines[5]),
-                        "rx_errors": int(lines[6]),
-                        "tx_errors": int(lines[7]),
-                    })
-            except Exception:
-                pass
+        counters_by_target = self._pool.map(self._read_counters, self._targets)
+        for (node, iface, _cmd), counters in zip(self._targets, counters_by_target):
+            if counters is None:
+                continue
+            record = {
+                "node": node.name,
+                "iface": iface,
+                "time": timestamp,
+                "relative_time_s": relative_timestamp,
+            }
+            record.update(zip(RAW_STAT_FIELDS, counters))
+            records.append(record)
         
         if records:
             try:
@@ -812,6 +850,7 @@ def stop(self) -> None:
         except Exception:
             pass
         self.join(timeout=2.0)
+        self._pool.shutdown(wait=False)
 
 
 def run_payment_traffic(
@@ -852,14 +891,19 @@ def run_payment_traffic(
     else:
         traffic_duration = config.duration
 
-    info(f"*** Physical client stations: {len(clients)}\n")
-    info(f"*** Accounts per station:    {config.accounts_per_station}\n")
-    info(f"*** Total virtual accounts:  {len(all_accounts)}\n")
-    info(f"*** Payment rate:            {config.payment_rate} tx/s\n")
-    info(f"*** Traffic duration:        {traffic_duration:.2f}s\n")
+    info(
+        f"*** Physical client stations: {len(clients)}\n"
+        f"*** Accounts per station:    {config.accounts_per_station}\n"
+        f"*** Total virtual accounts:  {len(all_accounts)}\n"
+        f"*** Payment rate:            {config.payment_rate} tx/s\n"
+        f"*** Traffic duration:        {traffic_duration:.2f}s\n"
+    )
 
     started_at = time.time()
-    traffic_deadline = started_at + traffic_duration
+    # Submission pacing uses the monotonic clock; started_at stays on wall
+    # time because it is compared with payment event timestamps.
+    paced_from = time.monotonic()
+    traffic_deadline = paced_from + traffic_duration
 
     # Start the network stats collector
     stats_collector = RawNetworkStatsCollector(
@@ -880,7 +924,7 @@ def run_payment_traffic(
     submitted_success = 0
     submitted_total = 0
     last_backpressure_log = 0.0
-    next_submit_at = started_at
+    next_submit_at = paced_from
     submit_interval = 1.0 / config.payment_rate
 
     def worker_task(sender, recipient):
@@ -928,7 +972,7 @@ def worker_task(sender, recipient):
     try:
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             while True:
-                now = time.time()
+                now = time.monotonic()
                 
                 # Check if traffic generation phase is over
                 if submitted_total >= target_payments or now >= traffic_deadline:
@@ -957,7 +1001,7 @@ def worker_task(sender, recipient):
                         break
 
                 if sender_account is None:
-                    now = time.time()
+                    now = time.monotonic()
                     with traffic_lock:
                         if now - last_backpressure_log > 0.5:
                             runtime.record_event(
@@ -982,8 +1026,8 @@ def worker_task(sender, recipient):
                     next_submit_at += submit_interval
 
                     # If we somehow fell massively behind (e.g. > 1 second), prevent infinite blast:
-                    if next_submit_at < time.time() - 1.0:
-                        next_submit_at = time.time()
+                    if next_submit_at < time.monotonic() - 1.0:
+                        next_submit_at = time.monotonic()
 
                 executor.submit(worker_task, sender_account, recipient_account)
         traffic_completed = True
@@ -1008,6 +1052,7 @@ def worker_task(sender, recipient):
 
     return started_at, ended_at, stats_collector
 
+
 def print_summary(report: dict) -> None:
     pm = report["payment_metrics"]
     nm = report.get("network_metrics", {})
@@ -1015,40 +1060,24 @@ def print_summary(report: dict) -> None:
     quorum = pm["latency_ms"]["time_to_quorum"]
     accepted = pm["latency_ms"]["time_to_acceptance"]
 
-    info("\n*** MeshPay payment benchmark summary\n")
-    info(f"payments_created:                  {summary['payments_created']}\n")
-    info(f"payments_confirmed:                {summary['payments_confirmed']}\n")
-    info(f"payments_unconfirmed:              {summary['payments_unconfirmed']}\n")
-    info(f"payments_accepted:                 {summary['payments_accepted']}\n")
-    info(f"payments_unaccepted:               {summary['payments_unaccepted']}\n")
-    info(f"payment_acceptance_rate_percent:   {summary['payment_acceptance_rate_percent']:.2f}%\n")
-
-    info(f"created_tps:                       {summary['created_tps']:.4f}\n")
-    info(f"confirmed_tps:                     {summary['confirmed_tps']:.4f}\n")
-    info(f"accepted_tps:                      {summary['accepted_tps']:.4f}\n")
+    parts = [SUMMARY_PAYMENTS_TMPL.format_map(summary)]
 
     if nm and "summary" in nm:
         nm_sum = nm["summary"]
-        info(f"tx_packets_per_second:             {nm_sum.get('tx_packets_rate', 0.0):.4f}\n")
-        info(f"rx_packets_per_second:             {nm_sum.get('rx_packets_rate', 0.0):.4f}\n")
-        info(f"tx_plus_rx_packets_per_second:     {nm_sum.get('tx_plus_rx_packets_rate', 0.0):.4f}\n")
-        info(f"tx_bytes_per_second:               {nm_sum.get('tx_bytes_rate', 0.0):.4f}\n")
-        info(f"rx_bytes_per_second:               {nm_sum.get('rx_bytes_rate', 0.0):.4f}\n")
-        info(f"tx_plus_rx_bytes_per_second:       {nm_sum.get('tx_plus_rx_bytes_rate', 0.0):.4f}\n")
+        rates = {key: nm_sum.get(key, 0.0) for key in SUMMARY_NETWORK_RATES}
+        parts.append(SUMMARY_NETWORK_TMPL.format_map(rates))
 
     if quorum["avg"] is not None:
-        info(f"avg_time_to_quorum_ms: {quorum['avg']:.4f}\n")
-        info(f"p50_time_to_quorum_ms: {quorum['p50']:.4f}\n")
-        info(f"p95_time_to_quorum_ms: {quorum['p95']:.4f}\n")
+        parts.append(SUMMARY_QUORUM_TMPL.format_map(quorum))
     else:
-        info("avg_time_to_quorum_ms: None\n")
+        parts.append("avg_time_to_quorum_ms: None\n")
 
     if accepted["avg"] is not None:
-        info(f"avg_time_to_acceptance_ms: {accepted['avg']:.4f}\n")
-        info(f"p50_time_to_acceptance_ms: {accepted['p50']:.4f}\n")
-        info(f"p95_time_to_acceptance_ms: {accepted['p95']:.4f}\n")
+        parts.append(SUMMARY_ACCEPTANCE_TMPL.format_map(accepted))
     else:
-        info("avg_time_to_acceptance_ms: None\n")
+        parts.append("avg_time_to_acceptance_ms: None\n")
+
+    info("".join(parts))
 
 
 def _set_lightweight_dtn_metric_env() -> dict[str, str | None]:
@@ -1245,9 +1274,11 @@ def topology(config: MeshPayBenchmarkConfig) -> None:
         write_reports(report, config.log_dir)
         print_summary(report)
 
-        info(f"\n*** Reports saved to: {config.log_dir}\n")
-        info(f"*** JSON: {config.log_dir / 'benchmark.json'}\n")
-        info(f"*** CSV:  {config.log_dir / 'benchmark.csv'}\n")
+        info(
+            f"\n*** Reports saved to: {config.log_dir}\n"
+            f"*** JSON: {config.log_dir / 'benchmark.json'}\n"
+            f"*** CSV:  {config.log_dir / 'benchmark.csv'}\n"
+        )
 
     finally:
         _restore_env(previous_env)
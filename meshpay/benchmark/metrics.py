@@ -4,9 +4,9 @@
 
 import json
 import statistics
-from collections import Counter, defaultdict
+from collections import Counter
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, List
 
 
 def load_jsonl(path: Path) -> List[Dict[str, Any]]:
@@ -351,40 +351,19 @@ def collect_payment_metrics(
 
     duration_s = max(ended_at - started_at, 0.000001)
 
-    payment_created = [
-        e for e in events
-        if e.get("event") == "payment_created"
-    ]
-
-    confirmation_created = [
-        e for e in events
-        if e.get("event") == "confirmation_created"
-    ]
-
-    payment_accepted = [
-        e for e in events
-        if e.get("event") == "payment_accepted"
-    ]
-
-    tx_events = [
-        e for e in events
-        if e.get("event") == "payload_injected"
-    ]
-
-    rx_events = [
-        e for e in events
-        if e.get("event") == "payment_payload_delivered"
-    ]
-
-    submit_failed = [
-        e for e in events
-        if e.get("event") == "payment_submit_failed"
-    ]
-
-    skipped = [
-        e for e in events
-        if e.get("event") == "payment_skipped"
-    ]
+    # Bucket events by kind in one pass instead of re-scanning the whole log
+    # once per event kind.
+    events_by_kind: Dict[str, List[Dict[str, Any]]] = {}
+    for e in events:
+        events_by_kind.setdefault(e.get("event"), []).append(e)
+
+    payment_created = events_by_kind.get("payment_created", [])
+    confirmation_created = events_by_kind.get("confirmation_created", [])
+    payment_accepted = events_by_kind.get("payment_accepted", [])
+    tx_events = events_by_kind.get("payload_injected", [])
+    rx_events = events_by_kind.get("payment_payload_delivered", [])
+    submit_failed = events_by_kind.get("payment_submit_failed", [])
+    skipped = events_by_kind.get("payment_skipped", [])
 
     created_by_order = {
         e["order_id"]: e
@@ -461,10 +440,7 @@ def collect_payment_metrics(
     payments_unconfirmed = max(payments_created - payments_confirmed, 0)
     payments_unaccepted = max(payments_created - payments_accepted_count, 0)
 
-    net_stats_events = [
-        e for e in events
-        if e.get("event") == "network_stats"
-    ]
+    net_stats_events = events_by_kind.get("network_stats", [])
 
     node_samples: dict[str, list[dict]] = {}
     for e in net_stats_events:
@@ -4,7 +4,7 @@
 
 import random
 from dataclasses import dataclass
-from typing import Iterable, Optional
+from typing import Dict, Iterable, List, Optional
 
 
 @dataclass(frozen=True)
@@ -47,6 +47,8 @@ def __init__(
         self.src = src
         self.dst = dst
         self.random = random.Random(seed)
+        self._station_names = [f"sta{i}" for i in range(1, stations + 1)]
+        self._candidates_except: Dict[str, List[str]] = {}
 
     def generate(self) -> Iterable[BenchmarkMessage]:
         for seq in range(self.messages):
@@ -82,14 +84,16 @@ def _select_pair(self) -> tuple[str, str]:
         while dst_index == src_index:
             dst_index = self.random.randint(1, self.stations)
 
-        return f"sta{src_index}", f"sta{dst_index}"
+        return self._station_names[src_index - 1], self._station_names[dst_index - 1]
 
     def _random_node_except(self, excluded: str) -> str:
-        candidates = [
-            f"sta{i}"
-            for i in range(1, self.stations + 1)
-            if f"sta{i}" != excluded
-        ]
+        # The excluded node is fixed for a run (--src or --dst), so the
+        # candidate list is built once instead of once per message.
+        candidates = self._candidates_except.get(excluded)
+
+        if candidates is None:
+            candidates = [name for name in self._station_names if name != excluded]
+            self._candidates_except[excluded] = candidates
 
         return self.random.choice(candidates)
 
@@ -3,19 +3,24 @@
 from __future__ import annotations
 
 import hashlib
+import io
 import json
 import os
 import shlex
 import socket
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Iterable, Optional
 from uuid import UUID
 
 from mininet.log import error, info
 from mn_wifi.cli import CLI
 from dtn import config as dtn_config
+from dtn.bundle import Bundle
+from dtn.jsoncodec import dumps_line
 from meshpay.benchmark.payment_metrics import collect_payment_metrics
 from meshpay.offline.virtual_accounts import account_host
 from meshpay.mininet_cmd import safe_node_cmd, node_cmd_lock
@@ -27,6 +32,71 @@
     TransferOrder,
 )
 
+MESHPAY_HELP = """
+MeshPay commands:
+  pay sta1 sta3 10
+  sta1 pay sta3 10
+  balance
+  balance sta1
+  payments
+  payments sta1
+  metrics
+  paymentlog
+  dtnlog
+  dtnlog sta1
+  delivered
+  delivered sta3
+
+"""
+
+ACCOUNTS_SHOWN = 50
+LOG_TAIL_WORKERS = 8
+DTN_LAUNCH_WORKERS = 8
+TAIL_CHUNK_SIZE = 64 * 1024
+
+# Matches every DTN router script (epidemic.py, spray_and_wait.py,
+# prophet.py), with or without the dtn/ prefix, in one pkill.
+DTN_ROUTER_PROCESS_PATTERN = r"(epidemic|spray_and_wait|prophet)\.py"
+
+# json.dumps() builds a fresh JSONEncoder whenever it gets non-default options;
+# payload sizing and control messages reuse these instead.
+_COMPACT_JSON = json.JSONEncoder(separators=(",", ":"), sort_keys=True)
+_SORTED_JSON = json.JSONEncoder(sort_keys=True)
+
+# Section banners, shared by the inspection commands.
+ACCOUNTS_HEADER_FMT = "\n===== accounts hosted by {} =====\n"
+PAYMENTS_HEADER_FMT = "\n===== payments {} =====\n"
+PAYMENT_LOG_HEADER_FMT = "\n===== payment log: {} =====\n"
+METRICS_HEADER_FMT = "\n===== MeshPay metrics: {} =====\n"
+NODE_LOG_HEADER_FMT = "\n===== {} {} =====\n"
+
+ACCOUNT_ROW_FMT = "{}: balance={}\n"
+PAYMENT_ROW_FMT = "order_id={} sender={} recipient={} amount={} status={}\n"
+
+BALANCE_HEADER_FMT = "\n===== balance {} =====\n"
+BALANCE_LOCAL_FMT = "client_local_balance={}\n"
+BALANCE_VIEW_PREFIX_FMT = "{}_view="
+
+
+def tail_lines(path: Path, count: int, chunk_size: int = TAIL_CHUNK_SIZE) -> list[str]:
+    """Return the last *count* lines of *path*.
+
+    Reads backwards from the end of the file in *chunk_size* blocks until
+    enough newlines have been seen, so the cost depends on the size of the
+    tail rather than the size of the file.
+    """
+
+    with path.open("rb") as handle:
+        position = handle.seek(0, os.SEEK_END)
+        data = b""
+        while position > 0 and data.count(b"\n") <= count:
+            step = min(chunk_size, position)
+            position -= step
+            handle.seek(position)
+            data = handle.read(step) + data
+
+    return data.decode("utf-8", errors="replace").splitlines()[-count:]
+
 
 class MeshPayRuntime:
     """Runtime controller for the interactive MeshPay offline demo.
@@ -96,6 +166,11 @@ def __init__(
         self.delivery_thread: Optional[threading.Thread] = None
         self._delivery_server: Optional[socket.socket] = None
         self._node_by_name = {node.name: node for node in self.nodes}
+        self._client_by_name = {node.name: node for node in self.clients}
+        self._authority_names = tuple(node.name for node in self.authorities)
+        # Orders created through pay_account(), by order id, so routing hints
+        # for later signed votes resolve without asking every node.
+        self._orders_by_id: dict[str, TransferOrder] = {}
 
         # Mininet node.cmd() is not thread-safe.  Use the shared per-node
         # command lock from meshpay.mininet_cmd so payment injection, attack
@@ -244,21 +319,31 @@ def peer_table(self) -> dict[str, tuple[str, str]]:
 
         return table
 
-    def peer_args_for(self, node, peer_table: dict[str, tuple[str, str]]) -> str:
-        args: list[str] = []
+    @staticmethod
+    def rendered_peer_args(peer_table: dict[str, tuple[str, str]]) -> list[tuple[str, str]]:
+        """Return ``(peer_name, "--peer ...")`` pairs sorted by peer name."""
+        rendered: list[tuple[str, str]] = []
 
         for peer_name, (peer_ip, peer_mac) in sorted(peer_table.items()):
-            if peer_name == node.name:
-                continue
-
             value = f"{peer_name}={peer_ip}"
 
             if peer_mac:
                 value = f"{value},{peer_mac}"
 
-            args.append(f"--peer {shlex.quote(value)}")
+            rendered.append((peer_name, f"--peer {shlex.quote(value)}"))
+
+        return rendered
+
+    def peer_args_for(
+        self,
+        node,
+        peer_table: dict[str, tuple[str, str]],
+        rendered: Optional[list[tuple[str, str]]] = None,
+    ) -> str:
+        if rendered is None:
+            rendered = self.rendered_peer_args(peer_table)
 
-        return " ".join(args)
+        return " ".join(arg for peer_name, arg in rendered if peer_name != node.name)
 
     def node_cmd(self, node, cmd: str) -> str:
         """Run node.cmd() under a per-node lock.
@@ -308,19 +393,21 @@ def start_dtn_routers(self) -> None:
         info(f"*** Starting MeshPay DTN routing: {self.routing}\n")
         info(f"*** DTN neighbour discovery mode: {self.medium}\n")
 
+        # Every daemon gets the same peer list minus itself and the same
+        # environment, so render both once rather than per node.
         peer_table = self.peer_table()
+        rendered_peers = self.rendered_peer_args(peer_table)
+        env_prefix = self.shell_env_prefix(self.dtn_env())
 
-        for node in self.nodes:
+        def launch(node):
             store = self.store_for(node.name)
             log_file = self.dtn_log_for(node.name)
 
-            self.node_cmd(node, f"rm -rf {shlex.quote(str(store))}")
-            self.node_cmd(node, f"mkdir -p {shlex.quote(str(store))}")
+            quoted_store = shlex.quote(str(store))
+            self.node_cmd(node, f"rm -rf {quoted_store}; mkdir -p {quoted_store}")
 
             wireless_iface = self.wireless_iface_for(node)
-            peer_args = self.peer_args_for(node, peer_table)
-
-            env_prefix = self.shell_env_prefix(self.dtn_env())
+            peer_args = self.peer_args_for(node, peer_table, rendered_peers)
 
             cmd = (
                 f"{env_prefix} "
@@ -342,8 +429,16 @@ def start_dtn_routers(self) -> None:
                 f"> {shlex.quote(str(log_file))} 2>&1 &"
             )
 
-            proc = node.popen(cmd, shell=True)
-            self.processes.append((node, proc))
+            return node, node.popen(cmd, shell=True)
+
+        # Preparing each store and spawning each daemon are independent
+        # per-node shell and process round trips, so launch them in
+        # parallel; map() keeps self.processes in node order.
+        if not self.nodes:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(DTN_LAUNCH_WORKERS, len(self.nodes))) as pool:
+            self.processes.extend(pool.map(launch, self.nodes))
 
     def stop_dtn_routers(self) -> None:
         info("*** Stopping MeshPay DTN daemons\n")
@@ -354,18 +449,11 @@ def stop_dtn_routers(self) -> None:
             except Exception:
                 pass
 
-        router_patterns = [
-            "dtn/epidemic.py",
-            "epidemic.py",
-            "dtn/spray_and_wait.py",
-            "spray_and_wait.py",
-            "dtn/prophet.py",
-            "prophet.py",
-        ]
+        pkill_cmd = f"pkill -f {shlex.quote(DTN_ROUTER_PROCESS_PATTERN)} || true"
 
-        for node in self.nodes:
-            for pattern in router_patterns:
-                self.node_cmd(node, f"pkill -f {shlex.quote(pattern)} || true")
+        if self.nodes:
+            with ThreadPoolExecutor(max_workers=min(DTN_LAUNCH_WORKERS, len(self.nodes))) as pool:
+                list(pool.map(lambda node: self.node_cmd(node, pkill_cmd), self.nodes))
 
         self.processes = []
 
@@ -504,9 +592,9 @@ def pay_account(
         src_name = account_host(sender_account)
         recipient_host = account_host(recipient_account)
 
-        src = self.net.get(src_name)
+        src = self._client_by_name.get(src_name)
 
-        if src not in self.clients:
+        if src is None:
             raise ValueError(f"{src_name} is not a MeshPay client station")
 
         order = src.pay(
@@ -515,7 +603,16 @@ def pay_account(
             sender_account=sender_account,
         )
 
+        self._orders_by_id[order.order_id_str] = order
+
         payload = DTNAdapter.to_payload(order)
+        # Both hosts are already resolved here; seed the routing hints so
+        # add_routing_hints() does not parse the account ids a second time.
+        payload["_meshpay_route"] = {
+            "sender_host": src_name,
+            "recipient_host": recipient_host,
+            "authority_targets": self._authority_names,
+        }
 
         self.record_event(
             {
@@ -525,17 +622,16 @@ def pay_account(
                 "sender_host": src_name,
                 "recipient_host": recipient_host,
                 "amount": amount,
-                "order_id": str(order.order_id),
+                "order_id": order.order_id_str,
                 "sequence_number": order.sequence_number,
             }
         )
 
-        for authority in self.authorities:
-            self.inject_payload(
-                src_name=src_name,
-                dst_name=authority.name,
-                payload=payload,
-            )
+        self.inject_payloads(
+            src_name=src_name,
+            dst_names=self._authority_names,
+            payload=payload,
+        )
 
     def inject_payload(self, src_name: str, dst_name: str, payload: dict) -> None:
         """Inject one MeshPay payload into the running source DTN daemon.
@@ -545,67 +641,81 @@ def inject_payload(self, src_name: str, dst_name: str, payload: dict) -> None:
         bundle, and avoids inbox.jsonl file polling.
         """
 
-        from dtn.bundle import Bundle
+        self.inject_payloads(src_name=src_name, dst_names=[dst_name], payload=payload)
+
+    def inject_payloads(self, src_name: str, dst_names: Iterable[str], payload: dict) -> None:
+        """Inject one MeshPay payload towards several destinations at once.
+
+        Fan-out payloads (transfer orders to every authority, confirmations to
+        the recipient and authorities) share routing hints, size accounting and
+        payload decoding, and reach the source daemon in a single
+        ``inject_batch`` control-socket round trip instead of one per
+        destination.
+        """
+
+        dst_names = list(dst_names)
+        if not dst_names:
+            return
 
-        src_node = self.net.get(src_name)
+        src_node = self._node_by_name.get(src_name) or self.net.get(src_name)
         payload = self.add_routing_hints(payload)
-        payload_json = json.dumps(payload, separators=(",", ":"), sort_keys=True)
+        payload_json = _COMPACT_JSON.encode(payload)
         payload_size_bytes = len(payload_json.encode("utf-8"))
 
-        bundle = Bundle.create(
+        bundles = Bundle.create_many(
             src=src_name,
-            dst=dst_name,
+            dsts=dst_names,
             payload=payload,
             ttl=self.bundle_ttl,
         )
-        bundle_id = bundle.bundle_id
 
-        response = self._send_control_message(
-            src_name,
-            {"type": "inject", "bundle": bundle.to_dict()},
-        )
-        if not response or response.get("type") != "inject_ack":
-            raise RuntimeError(f"invalid DTN inject response from {src_name}: {response!r}")
-        if not response.get("stored") and response.get("error"):
-            raise RuntimeError(f"DTN inject failed on {src_name}: {response.get('error')}")
-
-        sender = None
-        recipient = None
-        amount = None
+        if len(bundles) == 1:
+            response = self._send_control_message(
+                src_name,
+                {"type": "inject", "bundle": bundles[0].to_dict()},
+            )
+            if not response or response.get("type") != "inject_ack":
+                raise RuntimeError(f"invalid DTN inject response from {src_name}: {response!r}")
+            if not response.get("stored") and response.get("error"):
+                raise RuntimeError(f"DTN inject failed on {src_name}: {response.get('error')}")
+            injection_mode = "unix_control_socket"
+        else:
+            response = self._send_control_message(
+                src_name,
+                {"type": "inject_batch", "bundles": [bundle.to_dict() for bundle in bundles]},
+            )
+            if not response or response.get("type") != "inject_batch_ack":
+                raise RuntimeError(f"invalid DTN inject response from {src_name}: {response!r}")
+            injection_mode = "unix_control_socket_batch"
+
         try:
             obj = DTNAdapter.from_payload(
                 payload,
                 order_lookup=self.order_lookup_for_node(src_node),
             )
-            if isinstance(obj, TransferOrder):
-                sender = obj.sender
-                recipient = obj.recipient
-                amount = obj.amount
-            elif hasattr(obj, "transfer_order"):
-                sender = obj.transfer_order.sender
-                recipient = obj.transfer_order.recipient
-                amount = obj.transfer_order.amount
+            sender, recipient, amount = self.object_transfer_fields(obj)
         except Exception:
-            pass
+            sender, recipient, amount = None, None, None
 
-        self.record_event(
-            {
-                "event": "payload_injected",
-                "src": src_name,
-                "dst": dst_name,
-                "bundle_id": bundle_id,
-                "payload_type": payload.get("type"),
-                "payload_size_bytes": payload_size_bytes,
-                "sender": sender,
-                "recipient": recipient,
-                "amount": amount,
-                "injection_mode": "unix_control_socket",
-            }
-        )
+        for bundle in bundles:
+            self.record_event(
+                {
+                    "event": "payload_injected",
+                    "src": src_name,
+                    "dst": bundle.dst,
+                    "bundle_id": bundle.bundle_id,
+                    "payload_type": payload.get("type"),
+                    "payload_size_bytes": payload_size_bytes,
+                    "sender": sender,
+                    "recipient": recipient,
+                    "amount": amount,
+                    "injection_mode": injection_mode,
+                }
+            )
 
     def _send_control_message(self, node_name: str, message: dict, retries: int = 5) -> dict:
         socket_path = self.control_socket_for(node_name)
-        line = json.dumps(message, separators=(",", ":"), sort_keys=True) + "\n"
+        line = _COMPACT_JSON.encode(message) + "\n"
         last_error: Optional[Exception] = None
 
         for attempt in range(retries):
@@ -649,8 +759,13 @@ def add_routing_hints(self, payload: dict) -> dict:
         if ptype == "transfer_order":
             hints.setdefault("sender_host", account_host(data.get("sender") or data.get("s")))
             hints.setdefault("recipient_host", account_host(data.get("recipient") or data.get("r")))
-            hints.setdefault("authority_targets", [node.name for node in self.authorities])
-        elif ptype == "signed_transfer_order":
+            hints.setdefault("authority_targets", self._authority_names)
+        elif ptype == "signed_transfer_order" and not (
+            hints.get("sender_host") and hints.get("recipient_host")
+        ):
+            # Signed orders only carry the order id; resolving it means
+            # scanning every node (and every account of each authority), so
+            # callers that already hold the order should seed the hints.
             raw_order_id = str(data.get("order_id") or data.get("i") or "")
             order_id = raw_order_id
             if raw_order_id:
@@ -659,23 +774,31 @@ def add_routing_hints(self, payload: dict) -> dict:
                 except Exception:
                     order_id = raw_order_id
 
-            order = None
-            if order_id:
-                for node in self.nodes:
-                    order = self.lookup_order(node, order_id)
-                    if order is not None:
-                        break
+            order = self._orders_by_id.get(order_id)
+            if order is None and order_id:
+                order = next(
+                    (
+                        found
+                        for found in (self.lookup_order(node, order_id) for node in self.nodes)
+                        if found is not None
+                    ),
+                    None,
+                )
             if order is not None:
                 hints.setdefault("sender_host", account_host(order.sender))
                 hints.setdefault("recipient_host", account_host(order.recipient))
         elif ptype == "confirmation_order":
             hints.setdefault("sender_host", account_host(data.get("sender") or data.get("s")))
             hints.setdefault("recipient_host", account_host(data.get("recipient") or data.get("r")))
-            hints.setdefault("authority_targets", [node.name for node in self.authorities])
+            hints.setdefault("authority_targets", self._authority_names)
 
         payload["_meshpay_route"] = {key: value for key, value in hints.items() if value}
         return payload
 
+    def node(self, node_name: str):
+        """Return the MeshPay station called *node_name*, or None."""
+        return self._node_by_name.get(node_name)
+
     def store_for(self, node_name: str) -> Path:
         return self.log_dir / "stores" / self.routing / node_name
 
@@ -767,9 +890,16 @@ def lookup_order(self, node, order_id: str):
         if isinstance(signed_transfer_orders, dict):
             signatures_for_order = signed_transfer_orders.get(order_id)
             if isinstance(signatures_for_order, dict):
-                for signed in signatures_for_order.values():
+                signed = next(iter(signatures_for_order.values()), None)
+                if signed is not None:
                     return signed.transfer_order
 
+        # Authorities index their orders by id; only fall back to scanning
+        # every account state for nodes that do not.
+        node_lookup = getattr(node, "lookup_order", None)
+        if node_lookup is not None:
+            return node_lookup(order_id)
+
         state = getattr(node, "state", None)
         accounts = getattr(state, "accounts", None)
         if isinstance(accounts, dict):
@@ -801,20 +931,10 @@ def handle_payment_payload(
         except ValueError:
             return
 
-        payload_size_bytes = len(json.dumps(payload, sort_keys=True).encode("utf-8"))
+        payload_size_bytes = len(_SORTED_JSON.encode(payload).encode("utf-8"))
         order_id = self.object_order_id(obj)
 
-        sender = None
-        recipient = None
-        amount = None
-        if isinstance(obj, TransferOrder):
-            sender = obj.sender
-            recipient = obj.recipient
-            amount = obj.amount
-        elif hasattr(obj, "transfer_order"):
-            sender = obj.transfer_order.sender
-            recipient = obj.transfer_order.recipient
-            amount = obj.transfer_order.amount
+        sender, recipient, amount = self.object_transfer_fields(obj)
 
         delivery_event: dict = {
             "event": "payment_payload_delivered",
@@ -887,6 +1007,10 @@ def route_outgoing_object(self, src_node, obj) -> None:
         if isinstance(obj, SignedTransferOrder):
             order = obj.transfer_order
             dst = account_host(order.sender)
+            payload["_meshpay_route"] = {
+                "sender_host": dst,
+                "recipient_host": account_host(order.recipient),
+            }
 
             self.record_event(
                 {
@@ -919,7 +1043,7 @@ def route_outgoing_object(self, src_node, obj) -> None:
                     "amount": order.amount,
                     "sender_host": account_host(order.sender),
                     "recipient_host": recipient_host,
-                    "order_id": str(order.order_id),
+                    "order_id": order.order_id_str,
                     "signer_count": len(obj.authority_votes),
                     "collected_weight_units": sum(
                         vote.weight_units for vote in obj.authority_votes
@@ -944,12 +1068,11 @@ def route_outgoing_object(self, src_node, obj) -> None:
             # it already has the bundle in its store.
             destinations.discard(src_node.name)
 
-            for dst_name in destinations:
-                self.inject_payload(
-                    src_name=src_node.name,
-                    dst_name=dst_name,
-                    payload=payload,
-                )
+            self.inject_payloads(
+                src_name=src_node.name,
+                dst_names=sorted(destinations),
+                payload=payload,
+            )
 
             return
 
@@ -992,20 +1115,41 @@ def _flush_payment_log_locked(self) -> None:
         self.payment_log.parent.mkdir(parents=True, exist_ok=True)
         with self.payment_log.open("a", encoding="utf-8") as f:
             for event in pending:
-                f.write(json.dumps(event, sort_keys=True) + "\n")
+                f.write(dumps_line(event) + "\n")
         self._payment_log_flushed = len(self._payment_events)
 
     def flush_payment_log(self) -> None:
         with self._log_lock:
             self._flush_payment_log_locked()
 
+    @property
+    def payment_event_count(self) -> int:
+        """Number of payment events recorded so far (flushed or buffered)."""
+        return len(self._payment_events)
+
+    @staticmethod
+    def object_transfer_fields(obj) -> tuple:
+        """Return ``(sender, recipient, amount)`` for any payment object."""
+        # Every payload type is a known dataclass, so read the attributes
+        # directly and only fall back when an unexpected object turns up.
+        order = obj if isinstance(obj, TransferOrder) else getattr(obj, "transfer_order", None)
+        try:
+            return order.sender, order.recipient, order.amount
+        except AttributeError:
+            return None, None, None
+
     @staticmethod
     def object_order_id(obj) -> Optional[str]:
-        if hasattr(obj, "order_id"):
-            return str(obj.order_id)
+        try:
+            order_id = obj.order_id
+        except AttributeError:
+            order_id = None
+        if order_id is not None:
+            return str(order_id)
 
-        if hasattr(obj, "transfer_order"):
-            return str(obj.transfer_order.order_id)
+        transfer_order = getattr(obj, "transfer_order", None)
+        if transfer_order is not None:
+            return str(transfer_order.order_id)
 
         return None
 
@@ -1035,19 +1179,45 @@ class MeshPayCLI(CLI):
         delivered sta3
     """
 
+    # Re-running collect_payment_metrics() re-parses the whole payment.log.
+    # Repeated ``metrics`` calls within this window reuse the previous report
+    # as long as no new payment event was recorded in between.
+    METRICS_CACHE_TTL = 1.0
+
     def __init__(self, mininet, runtime: MeshPayRuntime, *args, **kwargs):
         self.runtime = runtime
+        self._metrics_cache: Optional[tuple[float, int, dict]] = None
         super().__init__(mininet, *args, **kwargs)
 
+    def _node(self, node_name: str):
+        """Resolve a node by name, reporting unknown names.
+
+        MeshPay stations come from the runtime's name index; anything else
+        (e.g. access points) falls back to the Mininet lookup.
+        """
+        node = self.runtime.node(node_name)
+        if node is None and node_name in self.mn:
+            node = self.mn.get(node_name)
+        if node is None:
+            error(f"*** Unknown node: {node_name}\n")
+        return node
+
     def default(self, line: str):
+        # Support:
+        #   sta1 pay sta3 10
+        # Everything else ("sta1 ping sta3", ...) goes straight to the
+        # Mininet handler, which does its own parsing; only tokenise with
+        # shlex when the second word really is "pay".
+        words = line.split(None, 2)
+        if len(words) < 2 or words[1] != "pay":
+            return super().default(line)
+
         try:
             args = shlex.split(line)
         except ValueError as exc:
             error(f"*** Parse error: {exc}\n")
             return
 
-        # Support:
-        #   sta1 pay sta3 10
         if len(args) == 4 and args[1] == "pay":
             return self._pay(args[0], args[2], args[3])
 
@@ -1138,27 +1308,45 @@ def do_accounts(self, line: str) -> None:
         else:
             node_names = [client.name for client in self.runtime.clients]
 
+        out = io.StringIO()
+
         for node_name in node_names:
-            if node_name not in self.mn:
-                error(f"*** Unknown node: {node_name}\n")
+            node = self._node(node_name)
+            if node is None:
                 continue
 
-            node = self.mn.get(node_name)
-
-            if not hasattr(node, "hosted_accounts"):
+            hosted_accounts = getattr(node, "hosted_accounts", None)
+            if hosted_accounts is None:
                 error(f"*** Node {node_name} does not expose hosted_accounts()\n")
                 continue
 
-            info(f"\n===== accounts hosted by {node_name} =====\n")
+            out.write(ACCOUNTS_HEADER_FMT.format(node_name))
+
+            wallets = getattr(node, "accounts", None)
+            if isinstance(wallets, dict):
+                # Clients host thousands of virtual accounts; read the first
+                # rows straight from the wallet map instead of materialising
+                # every account id and looking each one up again.
+                total = len(wallets)
+                shown = [
+                    (account_id, wallet.balance)
+                    for account_id, wallet in islice(wallets.items(), ACCOUNTS_SHOWN)
+                ]
+            else:
+                accounts = hosted_accounts(virtual_only=False)
+                account_balance = node.account_balance
+                total = len(accounts)
+                shown = [
+                    (account_id, account_balance(account_id))
+                    for account_id in accounts[:ACCOUNTS_SHOWN]
+                ]
 
-            accounts = node.hosted_accounts(virtual_only=False)
+            out.writelines(ACCOUNT_ROW_FMT.format(*row) for row in shown)
 
-            for account_id in accounts[:50]:
-                balance = node.account_balance(account_id)
-                info(f"{account_id}: balance={balance}\n")
+            if total > ACCOUNTS_SHOWN:
+                out.write(f"... {total - ACCOUNTS_SHOWN} more accounts hidden\n")
 
-            if len(accounts) > 50:
-                info(f"... {len(accounts) - 50} more accounts hidden\n")
+        info(out.getvalue())
 
     def do_balance(self, line: str) -> None:
         """Show client balance and authority views.
@@ -1168,31 +1356,44 @@ def do_balance(self, line: str) -> None:
             balance sta1
         """
 
-        args = shlex.split(line)
+        try:
+            args = shlex.split(line)
+        except ValueError as exc:
+            error(f"*** Parse error: {exc}\n")
+            return
 
         if args:
             node_names = args
         else:
             node_names = [node.name for node in self.runtime.clients]
 
+        # Resolve the authority views, and render their "<name>_view=" line
+        # prefixes, once instead of again for every requested node.
+        authority_views = [
+            (BALANCE_VIEW_PREFIX_FMT.format(authority.name), authority.balance_of)
+            for authority in self.runtime.authorities
+            if hasattr(authority, "balance_of")
+        ]
+
+        out = io.StringIO()
+
         for node_name in node_names:
-            if node_name not in self.mn:
-                error(f"*** Unknown node: {node_name}\n")
+            node = self._node(node_name)
+            if node is None:
                 continue
 
-            node = self.mn.get(node_name)
+            out.write(BALANCE_HEADER_FMT.format(node_name))
 
-            info(f"\n===== balance {node_name} =====\n")
+            # ``balance`` is a property summing every hosted wallet; hasattr()
+            # would evaluate it once just to probe, then again to print it.
+            local_balance = getattr(node, "balance", None)
+            if local_balance is not None:
+                out.write(BALANCE_LOCAL_FMT.format(local_balance))
 
-            if hasattr(node, "balance"):
-                info(f"client_local_balance={node.balance}\n")
+            for view_prefix, balance_of in authority_views:
+                out.write(f"{view_prefix}{balance_of(node_name)}\n")
 
-            for authority in self.runtime.authorities:
-                if hasattr(authority, "balance_of"):
-                    info(
-                        f"{authority.name}_view="
-                        f"{authority.balance_of(node_name)}\n"
-                    )
+        info(out.getvalue())
 
     def do_payments(self, line: str) -> None:
         """Show confirmation orders known by clients.
@@ -1202,31 +1403,49 @@ def do_payments(self, line: str) -> None:
             payments sta1
         """
 
-        args = shlex.split(line)
+        try:
+            args = shlex.split(line)
+        except ValueError as exc:
+            error(f"*** Parse error: {exc}\n")
+            return
 
         if args:
-            nodes = [self.mn.get(name) for name in args if name in self.mn]
+            nodes = [node for node in map(self._node, args) if node is not None]
         else:
             nodes = self.runtime.clients
 
-        for node in nodes:
-            info(f"\n===== payments {node.name} =====\n")
+        views = [(node.name, getattr(node, "confirmation_orders", None)) for node in nodes]
+
+        # Nothing to list anywhere: report once instead of printing an empty
+        # section per station.
+        if not any(confirmations for _name, confirmations in views):
+            info("\nNo confirmation orders\n")
+            return
 
-            confirmations = getattr(node, "confirmation_orders", {})
+        payment_row = PAYMENT_ROW_FMT.format
+        out = io.StringIO()
+
+        for node_name, confirmations in views:
+            out.write(PAYMENTS_HEADER_FMT.format(node_name))
 
             if not confirmations:
-                info("No confirmation orders\n")
+                out.write("No confirmation orders\n")
                 continue
 
-            for order_id, confirmation in confirmations.items():
-                order = confirmation.transfer_order
-                info(
-                    f"order_id={order_id} "
-                    f"sender={order.sender} "
-                    f"recipient={order.recipient} "
-                    f"amount={order.amount} "
-                    f"status={confirmation.status}\n"
+            out.write(
+                "".join(
+                    payment_row(
+                        order_id,
+                        confirmation.transfer_order.sender,
+                        confirmation.transfer_order.recipient,
+                        confirmation.transfer_order.amount,
+                        confirmation.status,
+                    )
+                    for order_id, confirmation in confirmations.items()
                 )
+            )
+
+        info(out.getvalue())
 
     def do_paymentlog(self, line: str) -> None:
         """Show MeshPay payment log.
@@ -1236,7 +1455,11 @@ def do_paymentlog(self, line: str) -> None:
             paymentlog 50
         """
 
-        args = shlex.split(line)
+        try:
+            args = shlex.split(line)
+        except ValueError as exc:
+            error(f"*** Parse error: {exc}\n")
+            return
 
         lines = 50
         if args:
@@ -1253,16 +1476,27 @@ def do_paymentlog(self, line: str) -> None:
 
         path = self.runtime.payment_log
 
-        info(f"\n===== payment log: {path} =====\n")
+        info(PAYMENT_LOG_HEADER_FMT.format(path))
 
         if not path.exists():
             info("No payment log\n")
             return
 
-        content = path.read_text(encoding="utf-8").splitlines()
+        if lines == 0:
+            # Whole log: print the file as-is rather than splitting it into
+            # a list of lines only to join them back together.
+            text = path.read_text(encoding="utf-8")
+            if text:
+                info(text if text.endswith("\n") else text + "\n")
+            return
+
+        if lines > 0:
+            content = tail_lines(path, lines)
+        else:
+            content = path.read_text(encoding="utf-8").splitlines()[-lines:]
 
-        for line in content[-lines:]:
-            info(line + "\n")
+        if content:
+            info("\n".join(content) + "\n")
 
     def do_metrics(self, _line: str) -> None:
         """Show MeshPay payment metrics including time to quorum.
@@ -1271,51 +1505,74 @@ def do_metrics(self, _line: str) -> None:
             metrics
         """
 
-        # Payment events are buffered in memory during normal operation.
-        # Flush before using the existing file-based metrics collector so the
-        # interactive metrics command reflects all events already processed by
-        # the runtime and delivery socket.
-        self.runtime.flush_payment_log()
-
-        started_at = self.runtime.started_at or time.time()
-        report = collect_payment_metrics(
-            log_dir=self.runtime.log_dir,
-            started_at=started_at,
-            ended_at=time.time(),
-        )
+        report = self._payment_metrics()
 
         summary = report["summary"]
         quorum = report["latency_ms"]["time_to_quorum"]
         accepted = report["latency_ms"]["time_to_acceptance"]
 
-        info(f"\n===== MeshPay metrics: {self.runtime.payment_log} =====\n")
-        info(f"payments_created:              {summary['payments_created']}\n")
-        info(f"payments_confirmed:            {summary['payments_confirmed']}\n")
-        info(f"payments_unconfirmed:          {summary['payments_unconfirmed']}\n")
-        info(f"payments_accepted:             {summary['payments_accepted']}\n")
-        info(f"payments_unaccepted:           {summary['payments_unaccepted']}\n")
-        info(
+        lines = [
+            METRICS_HEADER_FMT.format(self.runtime.payment_log),
+            f"payments_created:              {summary['payments_created']}\n"
+            f"payments_confirmed:            {summary['payments_confirmed']}\n"
+            f"payments_unconfirmed:          {summary['payments_unconfirmed']}\n"
+            f"payments_accepted:             {summary['payments_accepted']}\n"
+            f"payments_unaccepted:           {summary['payments_unaccepted']}\n"
             f"payment_confirmation_rate_pct: {summary['payment_confirmation_rate_percent']:.2f}\n"
-        )
-        info(
-            f"payment_acceptance_rate_pct:   {summary['payment_acceptance_rate_percent']:.2f}\n"
-        )
+            f"payment_acceptance_rate_pct:   {summary['payment_acceptance_rate_percent']:.2f}\n",
+        ]
 
         if quorum["avg"] is None:
-            info("time_to_quorum_ms: None\n")
+            lines.append("time_to_quorum_ms: None\n")
         else:
-            info(f"avg_time_to_quorum_ms: {quorum['avg']:.4f}\n")
-            info(f"p50_time_to_quorum_ms: {quorum['p50']:.4f}\n")
-            info(f"p95_time_to_quorum_ms: {quorum['p95']:.4f}\n")
-            info(f"min_time_to_quorum_ms: {quorum['min']:.4f}\n")
-            info(f"max_time_to_quorum_ms: {quorum['max']:.4f}\n")
+            lines.append(
+                f"avg_time_to_quorum_ms: {quorum['avg']:.4f}\n"
+                f"p50_time_to_quorum_ms: {quorum['p50']:.4f}\n"
+                f"p95_time_to_quorum_ms: {quorum['p95']:.4f}\n"
+                f"min_time_to_quorum_ms: {quorum['min']:.4f}\n"
+                f"max_time_to_quorum_ms: {quorum['max']:.4f}\n"
+            )
 
         if accepted["avg"] is None:
-            info("time_to_acceptance_ms: None\n")
+            lines.append("time_to_acceptance_ms: None\n")
         else:
-            info(f"avg_time_to_acceptance_ms: {accepted['avg']:.4f}\n")
-            info(f"p50_time_to_acceptance_ms: {accepted['p50']:.4f}\n")
-            info(f"p95_time_to_acceptance_ms: {accepted['p95']:.4f}\n")
+            lines.append(
+                f"avg_time_to_acceptance_ms: {accepted['avg']:.4f}\n"
+                f"p50_time_to_acceptance_ms: {accepted['p50']:.4f}\n"
+                f"p95_time_to_acceptance_ms: {accepted['p95']:.4f}\n"
+            )
+
+        info("".join(lines))
+
+    def _payment_metrics(self) -> dict:
+        # The cache window is measured on the monotonic clock so a wall-clock
+        # step cannot pin or skip a cached report.
+        checked_at = time.monotonic()
+        event_count = self.runtime.payment_event_count
+        cached = self._metrics_cache
+
+        if (
+            cached is not None
+            and cached[1] == event_count
+            and checked_at - cached[0] < self.METRICS_CACHE_TTL
+        ):
+            return cached[2]
+
+        # Payment events are buffered in memory during normal operation.
+        # Flush before using the existing file-based metrics collector so the
+        # interactive metrics command reflects all events already processed by
+        # the runtime and delivery socket.
+        self.runtime.flush_payment_log()
+
+        now = time.time()
+        started_at = self.runtime.started_at or now
+        report = collect_payment_metrics(
+            log_dir=self.runtime.log_dir,
+            started_at=started_at,
+            ended_at=now,
+        )
+        self._metrics_cache = (checked_at, event_count, report)
+        return report
 
     def do_dtnlog(self, line: str) -> None:
         """Show DTN daemon logs.
@@ -1325,33 +1582,23 @@ def do_dtnlog(self, line: str) -> None:
             dtnlog sta1
         """
 
-        args = shlex.split(line)
+        try:
+            args = shlex.split(line)
+        except ValueError as exc:
+            error(f"*** Parse error: {exc}\n")
+            return
 
         if args:
             node_names = args
         else:
             node_names = [node.name for node in self.runtime.nodes]
 
-        for node_name in node_names:
-            if node_name not in self.mn:
-                error(f"*** Unknown node: {node_name}\n")
-                continue
-
-            log_file = self.runtime.dtn_log_for(node_name)
-
-            info(f"\n===== {node_name} DTN log =====\n")
-
-            output = self.runtime.node_cmd(
-                self.mn.get(node_name),
-                f"test -f {shlex.quote(str(log_file))} "
-                f"&& tail -n 40 {shlex.quote(str(log_file))} "
-                f"|| true"
-            )
-
-            if output.strip():
-                info(output)
-            else:
-                info("No daemon log\n")
+        self._show_node_logs(
+            node_names,
+            path_for=self.runtime.dtn_log_for,
+            title="DTN log",
+            empty_message="No daemon log",
+        )
 
     def do_delivered(self, line: str) -> None:
         """Show delivered DTN bundles.
@@ -1361,47 +1608,60 @@ def do_delivered(self, line: str) -> None:
             delivered sta3
         """
 
-        args = shlex.split(line)
+        try:
+            args = shlex.split(line)
+        except ValueError as exc:
+            error(f"*** Parse error: {exc}\n")
+            return
 
         if args:
             node_names = args
         else:
             node_names = [node.name for node in self.runtime.nodes]
 
-        for node_name in node_names:
-            if node_name not in self.mn:
-                error(f"*** Unknown node: {node_name}\n")
-                continue
+        self._show_node_logs(
+            node_names,
+            path_for=self.runtime.delivered_log_for,
+            title="delivered.log",
+            empty_message="No delivered bundles",
+        )
+
+    def _show_node_logs(self, node_names, path_for, title: str, empty_message: str) -> None:
+        """Tail one log file per node and print the sections in order.
+
+        Each tail is a round trip through that node's shell.  Different nodes
+        have independent command locks, so the tails run concurrently and only
+        the printing is ordered.
+        """
 
-            delivered_log = self.runtime.delivered_log_for(node_name)
+        nodes = [node for node in map(self._node, node_names) if node is not None]
 
-            info(f"\n===== {node_name} delivered.log =====\n")
+        if not nodes:
+            return
 
-            output = self.runtime.node_cmd(
-                self.mn.get(node_name),
-                f"test -f {shlex.quote(str(delivered_log))} "
-                f"&& tail -n 40 {shlex.quote(str(delivered_log))} "
-                f"|| true"
+        def tail(node) -> str:
+            log_file = shlex.quote(str(path_for(node.name)))
+            return self.runtime.node_cmd(
+                node,
+                f"test -f {log_file} && tail -n 40 {log_file} || true",
             )
 
+        with ThreadPoolExecutor(max_workers=min(LOG_TAIL_WORKERS, len(nodes))) as pool:
+            outputs = list(pool.map(tail, nodes))
+
+        out = io.StringIO()
+
+        for node, output in zip(nodes, outputs):
+            out.write(NODE_LOG_HEADER_FMT.format(node.name, title))
+
             if output.strip():
-                info(output)
+                out.write(output)
             else:
-                info("No delivered bundles\n")
+                out.write(f"{empty_message}\n")
+
+        info(out.getvalue())
 
     def do_meshpay(self, _line: str) -> None:
         """Show MeshPay demo commands."""
 
-        info("\nMeshPay commands:\n")
-        info("  pay sta1 sta3 10\n")
-        info("  sta1 pay sta3 10\n")
-        info("  balance\n")
-        info("  balance sta1\n")
-        info("  payments\n")
-        info("  payments sta1\n")
-        info("  metrics\n")
-        info("  paymentlog\n")
-        info("  dtnlog\n")
-        info("  dtnlog sta1\n")
-        info("  delivered\n")
-        info("  delivered sta3\n\n")
+        info(MESHPAY_HELP)
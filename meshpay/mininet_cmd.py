@@ -12,6 +12,7 @@
 # (payment injection, packet-loss attack, debug commands, cleanup) serialises
 # access to the node shell.
 _LOCK_ATTR = "_meshpay_cmd_lock"
+_RLOCK_TYPE = type(threading.RLock())
 _FALLBACK_LOCKS: dict[int, threading.RLock] = {}
 _FALLBACK_LOCKS_GUARD = threading.RLock()
 
@@ -19,14 +20,21 @@
 def node_cmd_lock(node: Any) -> threading.RLock:
     """Return the shared command lock for a Mininet node."""
     lock = getattr(node, _LOCK_ATTR, None)
-    if isinstance(lock, threading.RLock().__class__):
+    if isinstance(lock, _RLOCK_TYPE):
         return lock
 
     with _FALLBACK_LOCKS_GUARD:
         lock = getattr(node, _LOCK_ATTR, None)
-        if isinstance(lock, threading.RLock().__class__):
+        if isinstance(lock, _RLOCK_TYPE):
             return lock
 
+        # A node that rejected the attribute once will reject it again; look
+        # it up here instead of failing setattr() on every command.
+        key = id(node)
+        existing = _FALLBACK_LOCKS.get(key)
+        if existing is not None:
+            return existing
+
         new_lock = threading.RLock()
         try:
             setattr(node, _LOCK_ATTR, new_lock)
@@ -34,12 +42,8 @@ def node_cmd_lock(node: Any) -> threading.RLock:
         except Exception:
             # Very defensive fallback in case a node implementation rejects
             # dynamic attributes.
-            key = id(node)
-            existing = _FALLBACK_LOCKS.get(key)
-            if existing is None:
-                _FALLBACK_LOCKS[key] = new_lock
-                existing = new_lock
-            return existing
+            _FALLBACK_LOCKS[key] = new_lock
+            return new_lock
 
 
 def safe_node_cmd(node: Any, cmd: str) -> str:
@@ -6,16 +6,19 @@
 import json
 from typing import Any, Dict, Optional
 
+# json.dumps() builds a new JSONEncoder for every call with non-default
+# options; every signature and verification goes through this one instead.
+_CANONICAL_ENCODER = json.JSONEncoder(
+    sort_keys=True,
+    separators=(",", ":"),
+    ensure_ascii=False,
+)
+
 
 def canonical_json(payload: Dict[str, Any]) -> str:
     """Return deterministic JSON for signing and verification."""
 
-    return json.dumps(
-        payload,
-        sort_keys=True,
-        separators=(",", ":"),
-        ensure_ascii=False,
-    )
+    return _CANONICAL_ENCODER.encode(payload)
 
 
 def sign_payload(node_id: str, payload: Dict[str, Any]) -> str:
@@ -18,6 +18,14 @@
 ]
 OrderLookup = Callable[[str], Optional[TransferOrder]]
 
+# Payload type -> decoder.  Every delivered DTN payload goes through
+# from_payload(), so the type is resolved with one dict lookup.
+_PAYLOAD_DECODERS: Dict[str, Callable[[Dict[str, Any], Optional[OrderLookup]], PaymentObject]] = {
+    "transfer_order": lambda payload, _order_lookup: TransferOrder.from_dtn_payload(payload),
+    "signed_transfer_order": SignedTransferOrder.from_dtn_payload,
+    "confirmation_order": ConfirmationOrder.from_dtn_payload,
+}
+
 
 class DTNAdapter:
     """Bridge between MeshPay payment objects and DTN payloads."""
@@ -32,20 +40,11 @@ def from_payload(
         order_lookup: OrderLookup | None = None,
     ) -> PaymentObject:
         payload_type = payload.get("type")
+        # Malformed payloads may carry an unhashable type; they must still
+        # surface as the ValueError callers handle.
+        decoder = _PAYLOAD_DECODERS.get(payload_type) if isinstance(payload_type, str) else None
 
-        if payload_type == "transfer_order":
-            return TransferOrder.from_dtn_payload(payload)
-
-        if payload_type == "signed_transfer_order":
-            return SignedTransferOrder.from_dtn_payload(
-                payload,
-                order_lookup=order_lookup,
-            )
-
-        if payload_type == "confirmation_order":
-            return ConfirmationOrder.from_dtn_payload(
-                payload,
-                order_lookup=order_lookup,
-            )
+        if decoder is not None:
+            return decoder(payload, order_lookup)
 
         raise ValueError(f"unsupported MeshPay offline payload type: {payload_type}")
@@ -76,6 +76,10 @@ def __init__(
             current_weight=snapshot.weight_for(name),
         )
 
+        # order_id -> TransferOrder for every order this authority has signed
+        # or applied, so lookups by id do not scan every account state.
+        self._orders_by_id: Dict[str, TransferOrder] = {}
+
         for account_address, balance in (initial_balances or {}).items():
             self.register_account(account_address, balance)
 
@@ -106,7 +110,7 @@ def handle_transfer(
             if existing_pending is not None:
                 existing_order = existing_pending.transfer_order
 
-                if str(existing_order.order_id) == str(order.order_id):
+                if existing_order.order_id == order.order_id:
                     return existing_pending
 
                 return None
@@ -141,6 +145,7 @@ def handle_transfer(
 
             sender_account.pending_confirmation = signed
             sender_account.last_update = time.time()
+            self._orders_by_id[order.order_id_str] = order
 
             return signed
 
@@ -148,7 +153,7 @@ def handle_confirmation(self, confirmation: ConfirmationOrder) -> bool:
         """Apply a confirmed transfer to authority account state."""
         with self._lock:
             order = confirmation.transfer_order
-            order_id = str(order.order_id)
+            order_id = order.order_id_str
 
             if not self._validate_confirmation(confirmation):
                 return False
@@ -164,6 +169,7 @@ def handle_confirmation(self, confirmation: ConfirmationOrder) -> bool:
             sender_account.pending_confirmation = None
             sender_account.confirmed_transfers[order_id] = confirmation
             sender_account.last_update = time.time()
+            self._orders_by_id[order_id] = order
 
             recipient_account.credit(order.amount)
 
@@ -188,6 +194,10 @@ def on_payment_object(self, obj) -> List[object]:
 
         return []
 
+    def lookup_order(self, order_id: str) -> Optional[TransferOrder]:
+        """Return a signed or confirmed TransferOrder known to this authority."""
+        return self._orders_by_id.get(str(order_id))
+
     def balance_of(self, account_address: str) -> int:
         account = self.state.accounts.get(account_address)
 
@@ -231,7 +241,7 @@ def _validate_transfer(self, order: TransferOrder) -> bool:
         if existing_pending is not None:
             existing_order = existing_pending.transfer_order
 
-            if str(existing_order.order_id) != str(order.order_id):
+            if existing_order.order_id != order.order_id:
                 return False
 
         return True
@@ -260,11 +270,12 @@ def _validate_confirmation(self, confirmation: ConfirmationOrder) -> bool:
         ):
             return False
 
+        order_signing = order.signing_dict()
         for vote in confirmation.authority_votes:
-            if not verify_authority_vote(order, vote, snapshot):
+            if not verify_authority_vote(order, vote, snapshot, order_signing):
                 return False
 
-        return has_weighted_quorum(order, confirmation.authority_votes, snapshot)
+        return has_weighted_quorum(order, confirmation.authority_votes, snapshot, order_signing)
 
     def _refresh_weight_state(self) -> None:
         tx_count, weight = self.weight_registry.authority_stats(self.name)
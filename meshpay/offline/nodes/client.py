@@ -11,7 +11,7 @@
 from mn_wifi.node import Station
 
 from meshpay.offline.virtual_accounts import make_account_id
-from meshpay.offline.crypto import sign_payload, verify_signature
+from meshpay.offline.crypto import sign_payload
 from meshpay.offline.quorum import has_weighted_quorum, verify_authority_vote
 from meshpay.offline.weighted_quorum import WeightRegistry
 from meshpay.offline.wallet import Wallet
@@ -134,7 +134,7 @@ def pay(
 
             order.signature = sign_payload(sender_account, order.signing_dict())
 
-            order_id = str(order.order_id)
+            order_id = order.order_id_str
 
             self.pending_by_account[sender_account] = order_id
             self.pending_transfers[order_id] = order
@@ -149,7 +149,7 @@ def handle_signed_transfer(
         """Collect authority signatures and form ConfirmationOrder on quorum."""
         with self._lock:
             order = signed.transfer_order
-            order_id = str(order.order_id)
+            order_id = order.order_id_str
 
             pending = self.pending_transfers.get(order_id)
 
@@ -208,7 +208,7 @@ def handle_confirmation(self, confirmation: ConfirmationOrder) -> bool:
         """Apply a ConfirmationOrder if this station hosts the recipient account."""
         with self._lock:
             order = confirmation.transfer_order
-            order_id = str(order.order_id)
+            order_id = order.order_id_str
 
             if order.recipient not in self.accounts:
                 return False
@@ -225,12 +225,13 @@ def handle_confirmation(self, confirmation: ConfirmationOrder) -> bool:
                 or not confirmation.authority_votes
             ):
                 return False
+            order_signing = order.signing_dict()
             if any(
-                not verify_authority_vote(order, vote, snapshot)
+                not verify_authority_vote(order, vote, snapshot, order_signing)
                 for vote in confirmation.authority_votes
             ):
                 return False
-            if not has_weighted_quorum(order, confirmation.authority_votes, snapshot):
+            if not has_weighted_quorum(order, confirmation.authority_votes, snapshot, order_signing):
                 return False
 
             wallet = self.accounts[order.recipient]
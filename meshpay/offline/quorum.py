@@ -9,9 +9,10 @@
 
 
 def authority_vote_signing_dict(order, authority: str, epoch: int, weight_units: int,
-                                total_weight_units: int, committee_digest: str) -> dict:
+                                total_weight_units: int, committee_digest: str,
+                                order_signing: dict | None = None) -> dict:
     return {
-        "transfer_order": order.signing_dict(),
+        "transfer_order": order_signing if order_signing is not None else order.signing_dict(),
         "authority": authority,
         "epoch": int(epoch),
         "weight_units": int(weight_units),
@@ -20,8 +21,14 @@ def authority_vote_signing_dict(order, authority: str, epoch: int, weight_units:
     }
 
 
-def verify_authority_vote(order, vote, snapshot: WeightSnapshot) -> bool:
-    if vote.authority not in snapshot.committee:
+def verify_authority_vote(order, vote, snapshot: WeightSnapshot,
+                          order_signing: dict | None = None) -> bool:
+    """Check one authority vote on *order* against *snapshot*.
+
+    Callers verifying several votes for the same order can pass
+    ``order_signing=order.signing_dict()`` so it is built only once.
+    """
+    if not snapshot.is_member(vote.authority):
         return False
     if vote.epoch != snapshot.epoch or vote.committee_digest != snapshot.committee_digest:
         return False
@@ -32,16 +39,20 @@ def verify_authority_vote(order, vote, snapshot: WeightSnapshot) -> bool:
     return verify_signature(
         vote.authority,
         authority_vote_signing_dict(order, vote.authority, vote.epoch, vote.weight_units,
-                                    vote.total_weight_units, vote.committee_digest),
+                                    vote.total_weight_units, vote.committee_digest,
+                                    order_signing),
         vote.signature,
     )
 
 
-def has_weighted_quorum(order, votes: Iterable, snapshot: WeightSnapshot) -> bool:
+def has_weighted_quorum(order, votes: Iterable, snapshot: WeightSnapshot,
+                        order_signing: dict | None = None) -> bool:
+    if order_signing is None:
+        order_signing = order.signing_dict()
     seen = set()
     total = 0
     for vote in votes:
-        if vote.authority in seen or not verify_authority_vote(order, vote, snapshot):
+        if vote.authority in seen or not verify_authority_vote(order, vote, snapshot, order_signing):
             continue
         seen.add(vote.authority)
         total += vote.weight_units
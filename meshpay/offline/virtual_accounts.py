@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+
 
 def make_account_id(station_name: str, account_index: int) -> str:
     """Return a logical account id hosted by one physical station.
@@ -13,6 +15,9 @@ def make_account_id(station_name: str, account_index: int) -> str:
     return f"{station_name}/u{account_index:05d}"
 
 
+# Account ids are a fixed set (stations x accounts per station) and every
+# routed payload resolves its sender and recipient hosts, so memoise them.
+@functools.lru_cache(maxsize=None)
 def account_host(account_id: str) -> str:
     """Return the physical station that hosts a logical account.
 
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import fcntl
+import functools
+import hashlib
 import json
 import math
 import os
+import time
 from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
@@ -16,6 +19,18 @@
 REGISTRY_VERSION = 1
 
 
+@functools.lru_cache(maxsize=None)
+def _committee_layout(committee: tuple[str, ...]) -> tuple[tuple[str, ...], frozenset[str], str]:
+    """Return the sorted committee, its member set and its digest.
+
+    Every client and authority in a run builds a registry for the same
+    committee, so the normalised layout is computed once and shared.
+    """
+    members = tuple(sorted(set(committee)))
+    digest = hashlib.sha256(",".join(members).encode("ascii")).hexdigest()
+    return members, frozenset(members), digest
+
+
 @dataclass(frozen=True)
 class WeightSnapshot:
     epoch: int
@@ -27,10 +42,17 @@ class WeightSnapshot:
     def weight_for(self, authority: str) -> int:
         return int(self.weights.get(authority, 0))
 
+    def is_member(self, authority: str) -> bool:
+        # ``weights`` is keyed by every committee member, so membership is a
+        # dict lookup rather than a scan of the ``committee`` tuple.
+        return authority in self.weights
+
 
 class WeightRegistry:
     """Persist weighted-quorum epochs with process-safe, idempotent updates."""
 
+    STATS_TTL = 0.5
+
     def __init__(
         self,
         path: str | Path,
@@ -40,7 +62,13 @@ def __init__(
     ) -> None:
         self.path = Path(path)
         self.lock_path = self.path.with_suffix(self.path.suffix + ".lock")
-        self.committee = tuple(sorted(set(committee)))
+        self.committee, self._committee_members, self.committee_digest = _committee_layout(
+            tuple(committee)
+        )
+        self._stats_cache: Dict[str, tuple[float, tuple[int, int]]] = {}
+        # An epoch's snapshot is written once, at rollover, and never changes
+        # afterwards, so parsed snapshots are kept for the registry's lifetime.
+        self._epoch_snapshots: Dict[int, WeightSnapshot] = {}
         self.epoch_size = int(epoch_size)
         self.max_power_share = float(max_power_share)
         if not self.committee:
@@ -49,6 +77,16 @@ def __init__(
             raise ValueError("weight epoch size must be at least 1")
         if not 0.0 < self.max_power_share <= 1.0:
             raise ValueError("max voting power share must be in (0, 1]")
+        # The committee is fixed for the registry's lifetime, so the expected
+        # configuration header is computed once here instead of on every
+        # locked read.
+        self._expected_configuration = {
+            "version": REGISTRY_VERSION,
+            "committee": list(self.committee),
+            "committee_digest": self.committee_digest,
+            "epoch_size": self.epoch_size,
+            "max_power_share": self.max_power_share,
+        }
 
     def initialize(self) -> WeightSnapshot:
         with self._locked_state() as state:
@@ -59,15 +97,20 @@ def current_snapshot(self) -> WeightSnapshot:
         return self.initialize()
 
     def snapshot_for_epoch(self, epoch: int) -> WeightSnapshot | None:
-        with self._locked_state() as state:
+        epoch = int(epoch)
+        cached = self._epoch_snapshots.get(epoch)
+        if cached is not None:
+            return cached
+
+        with self._locked_state(readonly=True) as state:
             self._validate_configuration(state)
-            raw = state["snapshots"].get(str(int(epoch)))
+            raw = state["snapshots"].get(str(epoch))
             return self._snapshot_from_raw(raw) if raw else None
 
     def record_finalization(self, order_id: str, signers: Iterable[str]) -> WeightSnapshot:
         """Record one finalized certificate and apply an epoch rollover if due."""
         unique_signers = sorted(set(signers))
-        if not unique_signers or any(signer not in self.committee for signer in unique_signers):
+        if not unique_signers or any(signer not in self._committee_members for signer in unique_signers):
             raise ValueError("finalization signers must be committee members")
 
         with self._locked_state() as state:
@@ -92,19 +135,37 @@ def record_finalization(self, order_id: str, signers: Iterable[str]) -> WeightSn
             return self._snapshot(state)
 
     def authority_stats(self, authority: str) -> tuple[int, int]:
-        snapshot = self.current_snapshot()
-        with self._locked_state() as state:
-            return int(state["tx_counts"].get(authority, 0)), snapshot.weight_for(authority)
+        """Return ``(tx_count, current_weight)`` for *authority*.
+
+        These figures are informational and are refreshed on every transfer
+        and confirmation, so answers are reused for ``STATS_TTL`` seconds
+        instead of taking the file lock each time.
+        """
+        now = time.monotonic()
+        cached = self._stats_cache.get(authority)
+        if cached is not None and now - cached[0] < self.STATS_TTL:
+            return cached[1]
+
+        with self._locked_state(readonly=True) as state:
+            self._validate_configuration(state)
+            stats = (
+                int(state["tx_counts"].get(authority, 0)),
+                self._snapshot(state).weight_for(authority),
+            )
+        self._stats_cache[authority] = (now, stats)
+        return stats
 
     @contextmanager
-    def _locked_state(self):
+    def _locked_state(self, readonly: bool = False):
         self.path.parent.mkdir(parents=True, exist_ok=True)
         lock = self.lock_path.open("a+", encoding="utf-8")
         fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
         try:
+            exists = self.path.exists()
             state = self._read_or_create()
             yield state
-            self._write(state)
+            if not readonly or not exists:
+                self._write(state)
         finally:
             fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
             lock.close()
@@ -114,7 +175,7 @@ def _read_or_create(self) -> dict:
             state = {
                 "version": REGISTRY_VERSION,
                 "committee": list(self.committee),
-                "committee_digest": self._committee_digest(),
+                "committee_digest": self.committee_digest,
                 "epoch_size": self.epoch_size,
                 "max_power_share": self.max_power_share,
                 "current_epoch": 0,
@@ -130,14 +191,7 @@ def _read_or_create(self) -> dict:
             return json.load(f)
 
     def _validate_configuration(self, state: dict) -> None:
-        expected = {
-            "version": REGISTRY_VERSION,
-            "committee": list(self.committee),
-            "committee_digest": self._committee_digest(),
-            "epoch_size": self.epoch_size,
-            "max_power_share": self.max_power_share,
-        }
-        for key, value in expected.items():
+        for key, value in self._expected_configuration.items():
             if state.get(key) != value:
                 raise ValueError(f"weighted quorum registry mismatch for {key}")
 
@@ -146,20 +200,25 @@ def _snapshot(self, state: dict) -> WeightSnapshot:
         return self._snapshot_from_raw(raw)
 
     def _snapshot_from_raw(self, raw: dict) -> WeightSnapshot:
-        return WeightSnapshot(
-            epoch=int(raw["epoch"]),
-            committee=tuple(raw["committee"]),
-            committee_digest=str(raw["committee_digest"]),
-            weights={str(k): int(v) for k, v in raw["weights"].items()},
-            total_weight_units=int(raw["total_weight_units"]),
-        )
+        epoch = int(raw["epoch"])
+        snapshot = self._epoch_snapshots.get(epoch)
+        if snapshot is None:
+            snapshot = WeightSnapshot(
+                epoch=epoch,
+                committee=tuple(raw["committee"]),
+                committee_digest=str(raw["committee_digest"]),
+                weights={str(k): int(v) for k, v in raw["weights"].items()},
+                total_weight_units=int(raw["total_weight_units"]),
+            )
+            self._epoch_snapshots[epoch] = snapshot
+        return snapshot
 
     def _make_snapshot(self, state: dict) -> dict:
         tx_counts = {name: int(state["tx_counts"][name]) for name in self.committee}
         return {
             "epoch": int(state["current_epoch"]),
             "committee": list(self.committee),
-            "committee_digest": self._committee_digest(),
+            "committee_digest": self.committee_digest,
             "weights": self._allocate_weights(tx_counts),
             "total_weight_units": TOTAL_WEIGHT_UNITS,
         }
@@ -193,12 +252,6 @@ def _allocate_weights(self, tx_counts: Dict[str, int]) -> Dict[str, int]:
                 remaining.remove(name)
         return allocated
 
-    def _committee_digest(self) -> str:
-        import hashlib
-
-        payload = ",".join(self.committee).encode("ascii")
-        return hashlib.sha256(payload).hexdigest()
-
     def _write(self, state: dict) -> None:
         temp_path = self.path.with_suffix(self.path.suffix + ".tmp")
         with temp_path.open("w", encoding="utf-8") as f:
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Canonical JSON and signature stability tests for meshpay.offline.crypto."""
+
+from __future__ import annotations
+
+import json
+import unittest
+from uuid import UUID
+
+from meshpay.offline.crypto import canonical_json, sign_payload, verify_signature
+from meshpay.types.transaction import TransferOrder
+
+ORDER_ID = UUID("2cd02ce4-c262-4ecf-b8ec-85654b995f24")
+# Produced by the original json.dumps-based canonical_json and the original
+# TransferOrder.signing_dict(); existing signatures must keep verifying.
+GOLDEN_CANONICAL = (
+    '{"amount":5,"epoch":2,"order_id":"2cd02ce4-c262-4ecf-b8ec-85654b995f24",'
+    '"recipient":"stä2/u1","sender":"sta1/u1","sequence_number":1,'
+    '"signature":null,"timestamp":1792120542.6146655,"ttl":45.0}'
+)
+GOLDEN_SIGNATURE = "43ee698e0721d04beb373285571dc571006b8dddd7aee69afc094d32fe80f26e"
+
+
+def make_order() -> TransferOrder:
+    return TransferOrder(
+        order_id=ORDER_ID,
+        sender="sta1/u1",
+        recipient="stä2/u1",
+        amount=5,
+        sequence_number=1,
+        timestamp=1792120542.6146655,
+        epoch=2,
+        ttl=45.0,
+    )
+
+
+class TestCanonicalJson(unittest.TestCase):
+    def test_matches_json_dumps(self):
+        payloads = [
+            {},
+            {"b": 1, "a": [1, 2.5, None, True], "c": {"z": "é", "y": " \"\\"}},
+            make_order().signing_dict(),
+        ]
+        for payload in payloads:
+            self.assertEqual(
+                canonical_json(payload),
+                json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False),
+            )
+
+    def test_order_signing_dict_is_stable(self):
+        order = make_order()
+        legacy = order.to_dict()
+        legacy["signature"] = None
+        self.assertEqual(order.signing_dict(), legacy)
+        self.assertEqual(canonical_json(order.signing_dict()), GOLDEN_CANONICAL)
+
+
+class TestSignatures(unittest.TestCase):
+    def test_signature_is_stable(self):
+        self.assertEqual(sign_payload("sta1/u1", make_order().signing_dict()), GOLDEN_SIGNATURE)
+
+    def test_signature_ignores_the_signature_field(self):
+        order = make_order()
+        order.signature = sign_payload(order.sender, order.signing_dict())
+        self.assertTrue(verify_signature(order.sender, order.signing_dict(), order.signature))
+
+    def test_verify_rejects_tampering(self):
+        order = make_order()
+        signature = sign_payload(order.sender, order.signing_dict())
+        order.amount = 6
+        self.assertFalse(verify_signature(order.sender, order.signing_dict(), signature))
+        self.assertFalse(verify_signature("sta3/u1", make_order().signing_dict(), signature))
+        self.assertFalse(verify_signature(order.sender, order.signing_dict(), None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Compact DTN payload round-trip tests for meshpay.types.transaction."""
+
+from __future__ import annotations
+
+import dataclasses
+import unittest
+from uuid import UUID, uuid4
+
+from dtn import jsoncodec
+from meshpay.offline.dtn_adapter import DTNAdapter
+from meshpay.types.common import TransactionStatus
+from meshpay.types.transaction import (
+    AuthorityVote,
+    ConfirmationOrder,
+    SignedTransferOrder,
+    TransferOrder,
+)
+
+ORDER_ID = UUID("2cd02ce4-c262-4ecf-b8ec-85654b995f24")
+
+
+def make_order(**overrides) -> TransferOrder:
+    fields = dict(
+        order_id=ORDER_ID,
+        sender="sta1/u1",
+        recipient="stä2/u1",
+        amount=5,
+        sequence_number=1,
+        timestamp=1792120542.6146655,
+        signature="sig",
+    )
+    fields.update(overrides)
+    return TransferOrder(**fields)
+
+
+def make_vote(authority: str = "auth1") -> AuthorityVote:
+    return AuthorityVote(
+        authority=authority,
+        signature="s-" + authority,
+        epoch=1,
+        weight_units=3,
+        total_weight_units=10,
+        committee_digest="d",
+    )
+
+
+def make_confirmation(order: TransferOrder, **overrides) -> ConfirmationOrder:
+    fields = dict(
+        order_id=order.order_id,
+        transfer_order=order,
+        authority_votes=[make_vote("auth1"), make_vote("auth2")],
+        timestamp=1792120543.25,
+        quorum_epoch=1,
+        total_weight_units=10,
+        committee_digest="d",
+        status=TransactionStatus.CONFIRMED,
+    )
+    fields.update(overrides)
+    return ConfirmationOrder(**fields)
+
+
+def over_the_wire(payload: dict) -> dict:
+    return jsoncodec.loads(jsoncodec.dumps_bytes(payload))
+
+
+class TestCompactPayloads(unittest.TestCase):
+    def test_transfer_order_round_trip(self):
+        for order in (make_order(), make_order(epoch=4, ttl=12.5, signature=None)):
+            decoded = DTNAdapter.from_payload(over_the_wire(DTNAdapter.to_payload(order)))
+            self.assertEqual(decoded, order)
+            self.assertEqual(decoded.order_id_str, str(ORDER_ID))
+
+    def test_signed_transfer_order_round_trip(self):
+        order = make_order()
+        signed = SignedTransferOrder(
+            order_id=ORDER_ID,
+            transfer_order=order,
+            authority_vote=make_vote(),
+            timestamp=1792120543.0,
+        )
+        lookups = []
+
+        def lookup(order_id):
+            lookups.append(order_id)
+            return order if order_id == str(ORDER_ID) else None
+
+        payload = over_the_wire(DTNAdapter.to_payload(signed))
+        self.assertEqual(DTNAdapter.from_payload(payload, order_lookup=lookup), signed)
+        self.assertEqual(lookups, [str(ORDER_ID)])
+
+        with self.assertRaises(ValueError):
+            DTNAdapter.from_payload(payload)
+        with self.assertRaises(ValueError):
+            DTNAdapter.from_payload(payload, order_lookup=lambda _order_id: None)
+
+    def test_confirmation_round_trip(self):
+        order = make_order(epoch=2)
+        confirmation = make_confirmation(order)
+        payload = over_the_wire(DTNAdapter.to_payload(confirmation))
+
+        self.assertEqual(DTNAdapter.from_payload(payload), confirmation)
+        self.assertEqual(
+            DTNAdapter.from_payload(payload, order_lookup=lambda _order_id: order),
+            confirmation,
+        )
+
+    def test_confirmation_defaults_to_confirmed(self):
+        confirmation = make_confirmation(make_order(), status=TransactionStatus.PENDING)
+        decoded = DTNAdapter.from_payload(over_the_wire(DTNAdapter.to_payload(confirmation)))
+        self.assertIs(decoded.status, TransactionStatus.CONFIRMED)
+
+    def test_confirmation_status_values(self):
+        data = make_confirmation(make_order()).to_compact_dict()
+        for value, expected in (
+            ("rejected", TransactionStatus.REJECTED),
+            (TransactionStatus.EXPIRED, TransactionStatus.EXPIRED),
+            (None, TransactionStatus.PENDING),
+        ):
+            decoded = ConfirmationOrder.from_compact_dict(dict(data, z=value))
+            self.assertIs(decoded.status, expected)
+
+        with self.assertRaises(ValueError):
+            ConfirmationOrder.from_compact_dict(dict(data, z="bogus"))
+
+    def test_compact_order_id_forms(self):
+        data = make_confirmation(make_order()).to_compact_dict()
+        self.assertEqual(data["i"], ORDER_ID.hex)
+        for order_id in (ORDER_ID.hex, str(ORDER_ID), ORDER_ID.hex.upper()):
+            decoded = ConfirmationOrder.from_compact_dict(dict(data, i=order_id))
+            self.assertEqual(decoded.order_id, ORDER_ID)
+            self.assertEqual(decoded.transfer_order.order_id, ORDER_ID)
+            self.assertEqual(decoded.transfer_order.order_id_str, str(ORDER_ID))
+
+    def test_unsupported_payload_types(self):
+        payload = DTNAdapter.to_payload(make_order())
+        for payload_type in ("unknown", None, ["transfer_order"], {"a": 1}):
+            with self.assertRaises(ValueError):
+                DTNAdapter.from_payload(dict(payload, type=payload_type))
+
+
+class TestTransferOrderIdString(unittest.TestCase):
+    def test_matches_order_id(self):
+        order = make_order(order_id=str(ORDER_ID))
+        self.assertEqual(order.order_id_str, str(ORDER_ID))
+        self.assertEqual(order.to_dict()["order_id"], str(ORDER_ID))
+        self.assertEqual(order.signing_dict()["order_id"], str(ORDER_ID))
+
+    def test_not_a_dataclass_field(self):
+        names = [f.name for f in dataclasses.fields(TransferOrder)]
+        self.assertNotIn("order_id_str", names)
+        self.assertNotIn("order_id_str", dataclasses.asdict(make_order()))
+
+    def test_follows_reassigned_order_id(self):
+        order = make_order()
+        self.assertEqual(order.order_id_str, str(ORDER_ID))
+        order.order_id = new_id = uuid4()
+        self.assertEqual(order.order_id_str, str(new_id))
+        self.assertEqual(order.to_dict()["order_id"], str(new_id))
+        self.assertEqual(order.signing_dict()["order_id"], str(new_id))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,6 +14,7 @@
 PAYMENT_APP = "meshpay.offline"
 COMPACT_PAYLOAD_VERSION = 3
 OrderLookup = Callable[[str], Optional["TransferOrder"]]
+_STATUS_BY_VALUE = {status.value: status for status in TransactionStatus}
 
 
 def _status_from_value(value: Any) -> TransactionStatus:
@@ -21,7 +22,8 @@ def _status_from_value(value: Any) -> TransactionStatus:
         return value
 
     if isinstance(value, str):
-        return TransactionStatus(value)
+        status = _STATUS_BY_VALUE.get(value)
+        return status if status is not None else TransactionStatus(value)
 
     return TransactionStatus.PENDING
 
@@ -62,6 +64,10 @@ class TransferOrder:
     epoch: int = 0
     ttl: float = 30.0
 
+    # Memoised ``(order_id, str(order_id))`` pair behind ``order_id_str``.
+    # Unannotated, so it is not a dataclass field.
+    _order_id_text = None
+
     def __post_init__(self) -> None:
         if isinstance(self.order_id, str):
             self.order_id = UUID(self.order_id)
@@ -76,9 +82,18 @@ def __post_init__(self) -> None:
         self.epoch = int(self.epoch)
         self.ttl = float(self.ttl)
 
+    @property
+    def order_id_str(self) -> str:
+        """Canonical string form of ``order_id``, the key orders are indexed by."""
+        cached = self._order_id_text
+        if cached is None or cached[0] is not self.order_id:
+            cached = (self.order_id, str(self.order_id))
+            self._order_id_text = cached
+        return cached[1]
+
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "order_id": str(self.order_id),
+            "order_id": self.order_id_str,
             "sender": self.sender,
             "recipient": self.recipient,
             "amount": self.amount,
@@ -109,9 +124,17 @@ def to_compact_dict(self) -> Dict[str, Any]:
         return data
 
     def signing_dict(self) -> Dict[str, Any]:
-        data = self.to_dict()
-        data["signature"] = None
-        return data
+        return {
+            "order_id": self.order_id_str,
+            "sender": self.sender,
+            "recipient": self.recipient,
+            "amount": self.amount,
+            "sequence_number": self.sequence_number,
+            "timestamp": self.timestamp,
+            "signature": None,
+            "epoch": self.epoch,
+            "ttl": self.ttl,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TransferOrder":
@@ -288,14 +311,16 @@ def from_compact_dict(
         data: Dict[str, Any],
         order_lookup: OrderLookup | None = None,
     ) -> "SignedTransferOrder":
-        order_id = str(UUID(str(data["i"])))
+        # Parse the id once; the lookup needs its canonical string form.
+        order_uuid = UUID(str(data["i"]))
+        order_id = str(order_uuid)
         transfer_order = order_lookup(order_id) if order_lookup else None
 
         if transfer_order is None:
             raise ValueError(f"missing transfer order for compact signed payload: {order_id}")
 
         return cls(
-            order_id=UUID(order_id),
+            order_id=order_uuid,
             transfer_order=transfer_order,
             authority_vote=AuthorityVote.from_compact_dict(data["v"]),
             timestamp=float(data.get("t", 0.0)),
@@ -424,12 +449,12 @@ def from_compact_dict(
         data: Dict[str, Any],
         order_lookup: OrderLookup | None = None,
     ) -> "ConfirmationOrder":
-        order_id = str(UUID(str(data["i"])))
-        transfer_order = order_lookup(order_id) if order_lookup else None
+        order_uuid = UUID(str(data["i"]))
+        transfer_order = order_lookup(str(order_uuid)) if order_lookup else None
 
         if transfer_order is None:
             transfer_order = TransferOrder(
-                order_id=UUID(order_id),
+                order_id=order_uuid,
                 sender=data["s"],
                 recipient=data["r"],
                 amount=int(data["a"]),
@@ -440,7 +465,7 @@ def from_compact_dict(
             )
 
         return cls(
-            order_id=UUID(order_id),
+            order_id=order_uuid,
             transfer_order=transfer_order,
             authority_votes=[AuthorityVote.from_compact_dict(vote) for vote in data.get("x", [])],
             timestamp=float(data.get("t", 0.0)),
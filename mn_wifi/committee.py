@@ -25,6 +25,8 @@
 import math
 from typing import Callable, Dict, Iterable, Mapping
 
+import numpy as np
+
 # Type aliases ---------------------------------------------------------------------------
 AuthorityName = str
 PerformanceStats = Mapping[str, object]  # whatever `get_performance_stats()` returns
@@ -61,6 +63,13 @@ def __init__(
         self._scores: Dict[AuthorityName, float] = {name: 0.0 for name in base_voting_rights}
         self._scoring_fn = scoring_fn or _default_scoring_fn
 
+        # Membership is fixed for the committee's lifetime, so the name order
+        # and the base-weight vector are built once.
+        self._names: tuple[AuthorityName, ...] = tuple(self._base_rights)
+        self._base_weights = np.fromiter(
+            self._base_rights.values(), dtype=float, count=len(self._names)
+        )
+
         # Cached derived values ----------------------------------------------------
         self._voting_power: Dict[AuthorityName, float] = {}
         self._total_power: float = 0.0
@@ -84,6 +93,24 @@ def update_performance(self, name: AuthorityName, stats: PerformanceStats) -> No
         self._scores[name] = max(self._scoring_fn(stats), 0.0)
         self.recalculate_powers()
 
+    def update_performances(self, stats_by_name: Mapping[AuthorityName, PerformanceStats]) -> None:
+        """Update several authorities at once and normalise a single time.
+
+        Equivalent to calling :py:meth:`update_performance` for each entry,
+        but the voting powers are recomputed once for the whole batch rather
+        than once per authority.
+        """
+        scores = {
+            name: max(self._scoring_fn(stats), 0.0)
+            for name, stats in stats_by_name.items()
+            if name in self._base_rights
+        }
+        if not scores:
+            return
+
+        self._scores.update(scores)
+        self.recalculate_powers()
+
     # Query ---------------------------------------------------------------------------
 
     def power(self, name: AuthorityName) -> float:
@@ -115,21 +142,23 @@ def has_quorum(self, signers: Iterable[AuthorityName]) -> bool:
 
     def recalculate_powers(self) -> None:
         """Recalculate normalised voting powers based on current scores."""
+        names = self._names
+
         # 1. Combine base weight with performance score ---------------------------
-        combined: Dict[AuthorityName, float] = {}
-        for name, base_weight in self._base_rights.items():
-            score = self._scores.get(name, 0.0)
-            combined[name] = float(base_weight) * score
+        combined = self._base_weights * np.fromiter(
+            (self._scores.get(name, 0.0) for name in names), dtype=float, count=len(names)
+        )
 
         # 2. Normalise so that Σ power = 1.0 (fallback to equal when all zero) ----
-        total = sum(combined.values())
+        total = float(combined.sum())
         if math.isclose(total, 0.0):
-            equal = 1.0 / len(self._base_rights)
-            self._voting_power = {name: equal for name in self._base_rights}
+            equal = 1.0 / len(names)
+            self._voting_power = dict.fromkeys(names, equal)
             self._total_power = 1.0
             return
 
-        self._voting_power = {name: val / total for name, val in combined.items()}
+        combined /= total
+        self._voting_power = dict(zip(names, combined.tolist()))
         self._total_power = 1.0  # by definition
 
 
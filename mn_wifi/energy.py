@@ -16,6 +16,22 @@
 from mn_wifi.clean import Cleanup as CleanupWifi
 
 
+_log_stamp = (None, "")
+
+
+def log_timestamp():
+    """Return the current time as "%Y-%m-%d %H:%M:%S".
+
+    Every interface of every node logs within the same second on each energy
+    tick, so the formatted string is reused until the second changes.
+    """
+    global _log_stamp
+    second = int(time.time())
+    if _log_stamp[0] != second:
+        _log_stamp = (second, datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S"))
+    return _log_stamp[1]
+
+
 class PlotEnergy:
     def __init__(self, nodes, title="Battery Consumption", **kwargs):
         import matplotlib.pyplot as plt  # lazy import to avoid slow pyparsing init
@@ -242,8 +258,7 @@ def get_bytes_consumption(self, node, intf):
         energy_in_wh = energy_in_joules * self.joules_to_wh
 
         # Produce log
-        current_datetime = datetime.now()
-        formatted_datetime = current_datetime.strftime("%Y-%m-%d %H:%M:%S")
+        formatted_datetime = log_timestamp()
         node.pexec('echo {},{},{},{} >> /tmp/net-consumption.log'.format(formatted_datetime, tx_diff, rx_diff, energy_in_wh), shell=True)
 
         return energy_in_wh
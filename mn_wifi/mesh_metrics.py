@@ -11,6 +11,7 @@
 import json
 import threading
 import time
+from array import array
 from dataclasses import asdict, dataclass
 from collections import defaultdict
 from statistics import mean
@@ -61,13 +62,15 @@ def __init__(self, *, run_label: str = "", start_time_s: Optional[float] = None)
         self._run_label = run_label
         self._t0 = start_time_s if start_time_s is not None else time.time()
 
-        # Per-transaction bookkeeping
+        # Per-transaction bookkeeping.  Latency samples accumulate for the
+        # whole run, so they are kept as packed C doubles (8 bytes each)
+        # rather than lists of boxed floats.
         self._tx_start_time_s: Dict[UUID, float] = {}
-        self._latency_samples_ms: List[float] = []
+        self._latency_samples_ms: array = array("d")
 
         # Generic KPI bookkeeping
         self._event_start_time_s: Dict[str, float] = {}
-        self._event_latency_samples_ms: Dict[str, List[float]] = defaultdict(list)
+        self._event_latency_samples_ms: Dict[str, array] = defaultdict(lambda: array("d"))
         self._event_counts: Dict[str, int] = defaultdict(int)
 
         # Counters
@@ -174,10 +177,9 @@ def _percentile(sorted_values: List[float], p: float) -> float:
 
     def _latency_stats(self) -> SummaryStats:
         with self._lock:
-            samples = list(self._latency_samples_ms)
+            samples = sorted(self._latency_samples_ms)
         if not samples:
             return SummaryStats(count=0, min_ms=0.0, avg_ms=0.0, p50_ms=0.0, p95_ms=0.0, p99_ms=0.0, max_ms=0.0)
-        samples.sort()
         return SummaryStats(
             count=len(samples),
             min_ms=samples[0],
@@ -212,18 +214,18 @@ def snapshot(self, *, explicit_duration_s: Optional[float] = None) -> Dict[str,
         success_rate = (succeeded / started) * 100.0 if started > 0 else 0.0
 
         with self._lock:
-            vote_rtt_samples = list(self._event_latency_samples_ms.get("vote_rtt", []))
-            handoff_samples = list(self._event_latency_samples_ms.get("handoff", []))
+            vote_rtt_samples = sorted(self._event_latency_samples_ms.get("vote_rtt", ()))
+            handoff_samples = sorted(self._event_latency_samples_ms.get("handoff", ()))
             cert_attempt = self._event_counts.get("certificate_attempt", 0)
             cert_built = self._event_counts.get("certificate_built", 0)
             replay_drop = self._event_counts.get("replay_drop", 0)
             dup_nonce = self._event_counts.get("duplicate_nonce_drop", 0)
             bcb_loss_rate = self._event_counts.get("bcb_loss_rate", 0.0) # Usually reported externally
 
-        vote_rtt_p50 = self._percentile(sorted(vote_rtt_samples), 50) if vote_rtt_samples else 0.0
-        vote_rtt_p95 = self._percentile(sorted(vote_rtt_samples), 95) if vote_rtt_samples else 0.0
-        handoff_p50 = self._percentile(sorted(handoff_samples), 50) if handoff_samples else 0.0
-        handoff_p95 = self._percentile(sorted(handoff_samples), 95) if handoff_samples else 0.0
+        vote_rtt_p50 = self._percentile(vote_rtt_samples, 50) if vote_rtt_samples else 0.0
+        vote_rtt_p95 = self._percentile(vote_rtt_samples, 95) if vote_rtt_samples else 0.0
+        handoff_p50 = self._percentile(handoff_samples, 50) if handoff_samples else 0.0
+        handoff_p95 = self._percentile(handoff_samples, 95) if handoff_samples else 0.0
 
         cert_assembly_rate = (cert_built / cert_attempt) if cert_attempt > 0 else 0.0
 
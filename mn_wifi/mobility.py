@@ -1277,16 +1277,14 @@ def gauss_markov(nodes, velocity_mean=1., alpha=0.99, variance=1.):
     nr_nodes = len(nodes)
     NODES = np.arange(nr_nodes)
 
-    MAX_X = U(0, 0, NODES)
-    MAX_Y = U(0, 0, NODES)
-    MIN_X = U(0, 0, NODES)
-    MIN_Y = U(0, 0, NODES)
-
-    for node in range(len(nodes)):
-        MAX_X[node] = nodes[node].max_x
-        MAX_Y[node] = nodes[node].max_y
-        MIN_X[node] = nodes[node].min_x
-        MIN_Y[node] = nodes[node].min_y
+    MAX_X = np.array([node.max_x for node in nodes], dtype=float)
+    MAX_Y = np.array([node.max_y for node in nodes], dtype=float)
+    MIN_X = np.array([node.min_x for node in nodes], dtype=float)
+    MIN_Y = np.array([node.min_y for node in nodes], dtype=float)
+    # The bounds used to start as four U(0, 0, NODES) placeholders, each
+    # drawing nr_nodes values; discard the same draws so a seeded run keeps
+    # its trajectory.
+    rand(4 * nr_nodes)
 
     x = U(MIN_X, MAX_X, NODES)
     y = U(MIN_Y, MAX_Y, NODES)
@@ -1297,39 +1295,43 @@ def gauss_markov(nodes, velocity_mean=1., alpha=0.99, variance=1.):
     alpha3 = np.sqrt(1.0 - alpha * alpha) * variance
 
     while True:
-        x = x + velocity * np.cos(theta)
-        y = y + velocity * np.sin(theta)
+        # x and y are private to the generator (each yield copies them),
+        # so they are advanced in place.
+        x += velocity * np.cos(theta)
+        y += velocity * np.sin(theta)
 
         # node bounces on the margins
-        b = np.where(x < MIN_X)[0]
+        b = x < MIN_X
         x[b] = 2 * MIN_X[b] - x[b]
         theta[b] = np.pi - theta[b]
         angle_mean[b] = np.pi - angle_mean[b]
 
-        b = np.where(x > MAX_X)[0]
+        b = x > MAX_X
         x[b] = 2 * MAX_X[b] - x[b]
         theta[b] = np.pi - theta[b]
         angle_mean[b] = np.pi - angle_mean[b]
 
-        b = np.where(y < MIN_Y)[0]
+        b = y < MIN_Y
         y[b] = 2 * MIN_Y[b] - y[b]
         theta[b] = -theta[b]
         angle_mean[b] = -angle_mean[b]
 
-        b = np.where(y > MAX_Y)[0]
+        b = y > MAX_Y
         y[b] = 2 * MAX_Y[b] - y[b]
         theta[b] = -theta[b]
         angle_mean[b] = -angle_mean[b]
-        # calculate new speed and direction based on the model
+        # calculate new speed and direction based on the model; one draw
+        # yields the same normal stream as two consecutive ones
+        noise = np.random.normal(0.0, 1.0, (2, nr_nodes))
         velocity = (alpha * velocity +
                     alpha2 * velocity_mean +
-                    alpha3 * np.random.normal(0.0, 1.0, nr_nodes))
+                    alpha3 * noise[0])
 
         theta = (alpha * theta +
                  alpha2 * angle_mean +
-                 alpha3 * np.random.normal(0.0, 1.0, nr_nodes))
+                 alpha3 * noise[1])
 
-        yield np.dstack((x, y))[0]
+        yield np.column_stack((x, y))
 
 
 def reference_point_group(nodes, n_groups, dimensions,
@@ -487,23 +487,28 @@ def addStation(self, name, cls=None, **params):
            cls: custom host class/constructor (optional)
            params: parameters for station
            returns: added station"""
-        # Default IP and MAC addresses
-        defaults = {'ip': ipAdd(self.nextIP,
-                                ipBaseNum=self.ipBaseNum,
-                                prefixLen=self.prefixLen) +
-                          '/{}'.format(self.prefixLen),
-                    'ip6': ipAdd6(self.nextIP6,
-                                  ipBaseNum=self.ip6BaseNum,
-                                  prefixLen=self.prefixLen6) +
-                          '/{}'.format(self.prefixLen6),
-                    'channel': self.channel,
-                    'band': self.band,
-                    'freq': self.freq,
-                    'mode': self.mode,
-                    'encrypt': self.encrypt,
-                    'passwd': self.passwd,
-                    'ieee80211w': self.ieee80211w
-                   }
+        # Default IP and MAC addresses; the address defaults are only
+        # rendered when the caller does not supply its own, as topologies
+        # that add many stations usually do.
+        defaults = {}
+        if 'ip' not in params:
+            defaults['ip'] = ipAdd(self.nextIP,
+                                   ipBaseNum=self.ipBaseNum,
+                                   prefixLen=self.prefixLen) + \
+                             '/{}'.format(self.prefixLen)
+        if 'ip6' not in params:
+            defaults['ip6'] = ipAdd6(self.nextIP6,
+                                     ipBaseNum=self.ip6BaseNum,
+                                     prefixLen=self.prefixLen6) + \
+                              '/{}'.format(self.prefixLen6)
+        defaults.update({'channel': self.channel,
+                         'band': self.band,
+                         'freq': self.freq,
+                         'mode': self.mode,
+                         'encrypt': self.encrypt,
+                         'passwd': self.passwd,
+                         'ieee80211w': self.ieee80211w
+                        })
         defaults.update(params)
 
         if self.autoSetPositions and 'position' not in params:
@@ -919,20 +924,24 @@ def buildFromWirelessTopo(self, topo=None):
         """Build mininet from a topology object
            At the end of this function, everything should be connected
            and up."""
+        # Node names are logged once per section rather than once per node:
+        # every info() call takes the logging lock and flushes.
         info('*** Adding stations:\n')
-        for staName in topo.stations():
+        staNames = topo.stations()
+        for staName in staNames:
             self.addStation(staName, **topo.nodeInfo(staName))
-            info(staName + ' ')
+        info(''.join(name + ' ' for name in staNames))
 
         info('\n*** Adding access points:\n')
-        for apName in topo.aps():
+        apNames = topo.aps()
+        for apName in apNames:
             # A bit ugly: add batch parameter if appropriate
             params = topo.nodeInfo(apName)
             cls = params.get('cls', self.accessPoint)
             if hasattr(cls, 'batchStartup'):
                 params.setdefault('batch', True)
             self.addAccessPoint(apName, **params)
-            info(apName + ' ')
+        info(''.join(name + ' ' for name in apNames))
 
         info('\n*** Configuring nodes...\n')
         self.configureNodes()
@@ -15,6 +15,14 @@
 from mn_wifi.services.core import settings, SUPPORTED_TOKENS
 from meshpay.logger.authorityLogger import AuthorityLogger
 
+# Checksummed token addresses by symbol, resolved once: to_checksum_address
+# hashes the address with keccak on every call.
+TOKEN_CHECKSUM_ADDRESSES: Dict[str, str] = {
+    symbol: Web3.to_checksum_address(config['address'])
+    for symbol, config in SUPPORTED_TOKENS.items()
+    if config.get('address')
+}
+
 
 @dataclass
 class AccountInfo:
@@ -144,7 +152,9 @@ async def get_onchain_balance(self, address: str, token_symbol: str, token_confi
                 # ERC20 token balance
                 try:
                     if token_address:
-                        token_address_checksum = Web3.to_checksum_address(token_address)
+                        token_address_checksum = TOKEN_CHECKSUM_ADDRESSES.get(token_symbol)
+                        if token_address_checksum is None:
+                            token_address_checksum = Web3.to_checksum_address(token_address)
                         
                         # Check if contract exists
                         code = self.w3.eth.get_code(token_address_checksum)
@@ -268,7 +278,7 @@ async def get_contract_stats(self) -> Optional[ContractStats]:
             total_native_balance = 0
             
             for token_symbol, token_config in SUPPORTED_TOKENS.items():
-                token_address = Web3.to_checksum_address(token_config['address'])
+                token_address = TOKEN_CHECKSUM_ADDRESSES[token_symbol]
                 # Note: totalBalance function was removed, so we'll calculate from individual accounts
                 total_balance = 0
                 
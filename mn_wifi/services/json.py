@@ -1,10 +1,26 @@
 import dataclasses
-from typing import Any
+from typing import Any, Dict, Tuple
 from uuid import UUID
 from enum import Enum
 
 # Recursive JSON-safe serialiser ------------------------------------
 
+# Field names per dataclass type, resolved once instead of on every call.
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+# Exact leaf types returned unchanged before walking the isinstance chain;
+# they make up most of the values in any serialised tree.
+_PASSTHROUGH_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _field_names(cls: type) -> Tuple[str, ...]:
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = tuple(f.name for f in dataclasses.fields(cls))
+    return names
+
+
 class JSONable:
     def _to_jsonable(self, obj: Any) -> Any:  # noqa: ANN401 – generic helper
         """Return *obj* converted into JSON-serialisable structures.
@@ -16,8 +32,17 @@ def _to_jsonable(self, obj: Any) -> Any:  # noqa: ANN401 – generic helper
         • everything else returned unchanged.
         """
 
-        if dataclasses.is_dataclass(obj):
-            return {k: self._to_jsonable(v) for k, v in dataclasses.asdict(obj).items()}
+        obj_type = type(obj)
+        if obj_type in _PASSTHROUGH_TYPES:
+            return obj
+
+        if obj_type is UUID:
+            return str(obj)
+
+        if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            # Read fields directly: asdict() would deep-copy the whole tree
+            # only for it to be walked again here.
+            return {k: self._to_jsonable(getattr(obj, k)) for k in _field_names(type(obj))}
 
         if isinstance(obj, dict):
             return {k: self._to_jsonable(v) for k, v in obj.items()}